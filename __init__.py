@@ -2,11 +2,70 @@
 
 OPENGL: int                      = 1 << 0
 MOUSE: int                       = 1 << 1
+HEADLESS: int                    = 1 << 2
 
-import pge.types
-import pge.utils
+import importlib.machinery
+import importlib.abc
+import importlib
+import typing
+import time
+import sys
 
-import pge.mgl
-import pge.core
+_SUBPACKAGES: typing.Final[tuple[str]] = ('types', 'utils', 'mgl', 'core', 'containers', 'headless', 'benchmarks')
 
-import pge.containers
+startup_times: dict[str, float] = {}
+
+class _TimedLoader(importlib.abc.Loader):
+    _nested: typing.ClassVar[list[float]] = []
+
+    def __init__(self, loader: importlib.abc.Loader):
+        self.loader: importlib.abc.Loader = loader
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> typing.Any:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: typing.Any) -> None:
+        self._nested.append(0.0)
+        start: float = time.perf_counter()
+
+        try:
+            self.loader.exec_module(module)
+        finally:
+            elapsed: float = time.perf_counter() - start
+            nested: float = self._nested.pop()
+
+            if self._nested:
+                self._nested[-1] += elapsed
+
+            startup_times[f'import.{module.__name__.rpartition(".")[2]}'] = elapsed - nested
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname: str, path: typing.Any, target: typing.Any = None) -> typing.Union[importlib.machinery.ModuleSpec, None]:
+        package, _, name = fullname.rpartition('.')
+        if package != __name__ or name not in _SUBPACKAGES:
+            return None
+
+        spec: typing.Union[importlib.machinery.ModuleSpec, None] = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _TimedLoader(spec.loader)
+
+        return spec
+
+if not any(isinstance(finder, _ImportTimer) for finder in sys.meta_path):
+    sys.meta_path.insert(0, _ImportTimer())
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return importlib.import_module(f'{__name__}.{name}')
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_SUBPACKAGES])
+
+def get_startup_report() -> str:
+    width: int = max((len(phase) for phase in startup_times), default=0)
+    return '\n'.join(f'{phase:<{width}} {seconds * 1000:>9.3f} ms' for phase, seconds in startup_times.items())
@@ -0,0 +1,16 @@
+#version 330 core
+
+uniform sampler2D atlas;
+
+in vec2 uv;
+in vec4 color;
+out vec4 f_color;
+
+void main() {
+  vec4 texel = texture(atlas, uv) * color;
+  if (texel.a == 0.0) {
+    discard;
+  }
+
+  f_color = texel;
+}
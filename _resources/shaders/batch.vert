@@ -0,0 +1,27 @@
+#version 330 core
+
+uniform vec2 screen;
+uniform vec2 camera;
+uniform vec2 viewport;
+uniform float zoom;
+
+in vec2 vert;
+
+in vec2 position;
+in vec2 size;
+in vec4 uv_rect;
+in float layer;
+in vec4 tint;
+
+out vec2 uv;
+out vec4 color;
+
+void main() {
+    uv = uv_rect.xy + vert * uv_rect.zw;
+    color = tint;
+
+    vec2 pixel = (position + vert * size - camera) * zoom + viewport;
+    vec2 ndc = vec2(pixel.x / screen.x * 2.0 - 1.0, 1.0 - pixel.y / screen.y * 2.0);
+
+    gl_Position = vec4(ndc, clamp(-layer / 1024.0, -1.0, 1.0), 1.0);
+}
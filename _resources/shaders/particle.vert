@@ -0,0 +1,41 @@
+#version 330 core
+
+uniform vec2 screen;
+uniform float time;
+uniform vec2 gravity;
+uniform float drag;
+uniform float layer;
+uniform bool fade;
+
+in vec2 vert;
+
+in float x;
+in float y;
+in float vx;
+in float vy;
+in float birth;
+in float death;
+in float size;
+in vec4 tint;
+
+out vec2 uv;
+out vec4 color;
+
+void main() {
+    float age = time - birth;
+    float travel = drag > 0.0 ? (1.0 - exp(-drag * age)) / drag : age;
+
+    vec2 center = vec2(x, y) + vec2(vx, vy) * travel + 0.5 * gravity * age * age;
+
+    uv = vert;
+    color = tint;
+
+    if (fade) {
+        color.a *= clamp((death - time) / (death - birth), 0.0, 1.0);
+    }
+
+    vec2 pixel = center + (vert - 0.5) * size;
+    vec2 ndc = vec2(pixel.x / screen.x * 2.0 - 1.0, 1.0 - pixel.y / screen.y * 2.0);
+
+    gl_Position = vec4(ndc, clamp(-layer / 1024.0, -1.0, 1.0), 1.0);
+}
@@ -0,0 +1 @@
+from pge.benchmarks.suite import run, compare, save, load, SIZES
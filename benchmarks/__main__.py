@@ -0,0 +1,47 @@
+from pge.benchmarks import run, compare, save, load, SIZES
+
+import argparse
+import math
+import sys
+
+def main() -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog='python -m pge.benchmarks')
+    parser.add_argument('names', nargs='*', help=f'workloads to run, from: {", ".join(SIZES)} (default: all)')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--scale', type=float, default=1.0, help='multiplier applied to every workload size')
+    parser.add_argument('--output', help='write results as JSON to this path')
+    parser.add_argument('--compare', help='baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown before flagging a regression')
+
+    args: argparse.Namespace = parser.parse_args()
+
+    for name in args.names:
+        if name not in SIZES:
+            parser.error(f'unknown workload {name}')
+
+    results: dict[str, any] = run(args.names, args.repeat, args.scale)
+
+    for key, result in results['results'].items():
+        if 'error' in result:
+            print(f'{key:<36} {result["error"]}')
+        else:
+            print(f'{key:<36} {result["median"] * 1000:>10.3f} ms (min {result["min"] * 1000:.3f} ms)')
+
+    if args.output:
+        save(results, args.output)
+
+    if args.compare:
+        regressions: list[tuple[str, float, float]] = compare(results, load(args.compare), args.threshold)
+        for key, before, after in regressions:
+            if after == math.inf:
+                print(f'REGRESSION {key}: {before * 1000:.3f} ms -> {results["results"][key]["error"]}')
+            else:
+                print(f'REGRESSION {key}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms ({after / before - 1:+.1%})')
+
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,275 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import statistics
+import math
+import platform
+import tempfile
+import pygame
+import typing
+import json
+import time
+
+BenchmarkResult = typing.NewType('BenchmarkResult', dict[str, typing.Union[int, float, str]])
+Workload = typing.NewType('Workload', typing.Callable[[int], typing.Callable[[], None]])
+
+SIZES: typing.Final[dict[str, tuple[int, ...]]] = {
+    'font_create': (16, 256),
+    'font_create_cached': (16, 256),
+    'sprite_list_append': (100, 2000),
+    'sprite_list_update_all': (100, 2000),
+    'sprite_mask': (100, 2000),
+    'sprite_mask_cold': (100, 2000),
+    'load_spritesheet': (256, 4096),
+    'load_spritesheet_cold': (256, 4096),
+    'mgl_render': (1000, 10000),
+    'particle_update': (5000, 50000)
+}
+
+_workloads: dict[str, Workload] = {}
+_directories: list[tempfile.TemporaryDirectory] = []
+
+def workload(name: str) -> typing.Callable[[Workload], Workload]:
+    def decorator(func: Workload) -> Workload:
+        _workloads[name] = func
+        return func
+
+    return decorator
+
+def _get_image(dimensions: typing.Optional[tuple[int, int]] = (8, 8)) -> pygame.Surface:
+    image: pygame.Surface = pygame.Surface(dimensions).convert_alpha()
+    image.fill((255, 255, 255))
+
+    return image
+
+def _save_sheet(n: int) -> str:
+    sheet: pygame.Surface = pygame.Surface((n, 16)).convert_alpha()
+    sheet.fill((255, 255, 255))
+
+    for x in range(15, n, 16):
+        sheet.set_at((x, 0), (255, 0, 0))
+
+    directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+    _directories.append(directory)
+
+    path: str = os.path.join(directory.name, 'sheet.png')
+    pygame.image.save(sheet, path)
+
+    return path
+
+@workload('font_create')
+def _font_create(n: int) -> typing.Callable[[], None]:
+    from pge.core import Font
+
+    font: Font = Font()
+    text: str = ('abcdefghij' * (n // 10 + 1))[:n]
+
+    def run() -> None:
+        font.clear_cache()
+        font.create(text)
+
+    return run
+
+@workload('font_create_cached')
+def _font_create_cached(n: int) -> typing.Callable[[], None]:
+    from pge.core import Font
+
+    font: Font = Font()
+    text: str = ('abcdefghij' * (n // 10 + 1))[:n]
+
+    return lambda: font.create(text)
+
+@workload('sprite_list_append')
+def _sprite_list_append(n: int) -> typing.Callable[[], None]:
+    from pge.containers import SpriteList
+    from pge.core import Sprite
+
+    image: pygame.Surface = _get_image()
+    sprites: list[Sprite] = [Sprite(image, i % 8) for i in range(n)]
+
+    def run() -> None:
+        sprite_list: SpriteList = SpriteList()
+        for sprite in sprites:
+            sprite_list.append(sprite)
+
+    return run
+
+@workload('sprite_list_update_all')
+def _sprite_list_update_all(n: int) -> typing.Callable[[], None]:
+    from pge.containers import SpriteList
+    from pge.core import Sprite
+
+    class _Sprite(Sprite):
+        def update(self) -> typing.Union[None, str]:
+            return SpriteList.SPRITELIST_DELETE if self.layer == 0 else None
+
+    image: pygame.Surface = _get_image()
+    sprites: list[Sprite] = [_Sprite(image, i % 2) for i in range(n)]
+
+    def run() -> None:
+        sprite_list: SpriteList = SpriteList(sprites)
+        sprite_list.update_all()
+
+    return run
+
+@workload('sprite_mask')
+def _sprite_mask(n: int) -> typing.Callable[[], None]:
+    from pge.core import Sprite
+
+    sprites: list[Sprite] = [Sprite(_get_image((32, 32))) for _ in range(n)]
+
+    def run() -> None:
+        for sprite in sprites:
+            sprite.mask
+
+    return run
+
+@workload('sprite_mask_cold')
+def _sprite_mask_cold(n: int) -> typing.Callable[[], None]:
+    from pge.utils.functions import _MASKS
+    from pge.core import Sprite
+
+    sprites: list[Sprite] = [Sprite(_get_image((32, 32))) for _ in range(n)]
+
+    def run() -> None:
+        _MASKS.clear()
+
+        for sprite in sprites:
+            sprite.image = sprite.image
+            sprite.mask
+
+    return run
+
+@workload('load_spritesheet')
+def _load_spritesheet(n: int) -> typing.Callable[[], None]:
+    from pge.utils import load_spritesheet
+
+    path: str = _save_sheet(n)
+    return lambda: load_spritesheet(path)
+
+@workload('load_spritesheet_cold')
+def _load_spritesheet_cold(n: int) -> typing.Callable[[], None]:
+    from pge.utils.spritesheet_loader import SPRITESHEET_LAYOUT_EXTENSION
+    from pge.utils import load_spritesheet
+
+    path: str = _save_sheet(n)
+
+    def run() -> None:
+        if os.path.exists(path + SPRITESHEET_LAYOUT_EXTENSION):
+            os.remove(path + SPRITESHEET_LAYOUT_EXTENSION)
+
+        load_spritesheet(path)
+
+    return run
+
+@workload('mgl_render')
+def _mgl_render(n: int) -> typing.Callable[[], None]:
+    from pge.containers import SpriteList
+    from pge.mgl import MGLRenderer
+    from pge.core import Sprite
+
+    mgl: MGLRenderer = MGLRenderer((640, 360), standalone=True, backend=os.environ.get('PGE_GL_BACKEND', 'egl'))
+    if 'benchmark' not in mgl.batches:
+        mgl.Batch.create('benchmark')
+
+    images: list[pygame.Surface] = [_get_image() for _ in range(16)]
+    sprite_list: SpriteList = SpriteList([Sprite(images[i % 16], 0, pygame.Vector2(i % 640, i % 360)) for i in range(n)])
+
+    def run() -> None:
+        sprite_list.render_all(batch='benchmark')
+        mgl.render()
+        mgl.context.finish()
+
+    return run
+
+@workload('particle_update')
+def _particle_update(n: int) -> typing.Callable[[], None]:
+    from pge.containers import ParticleEmitter
+
+    emitter: ParticleEmitter = ParticleEmitter(_get_image((4, 4)), capacity=n, lifetime=(30.0, 90.0), gravity=(0.0, 0.1))
+
+    def run() -> None:
+        emitter.emit(n - emitter.count)
+        emitter.update(1.0)
+
+    return run
+
+def _time(func: typing.Callable[[], None], repeat: int) -> list[float]:
+    func()
+
+    times: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return times
+
+def run(names: typing.Optional[typing.Sequence[str]] = None, repeat: typing.Optional[int] = 10,
+        scale: typing.Optional[float] = 1.0) -> dict[str, any]:
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    results: dict[str, BenchmarkResult] = {}
+
+    for name in (names or _workloads):
+        for n in SIZES[name]:
+            n = max(1, int(n * scale))
+            key: str = f'{name}[{n}]'
+
+            try:
+                times: list[float] = _time(_workloads[name](n), repeat)
+            except Exception as e:
+                results[key] = {'name': name, 'n': n, 'error': f'{e.__class__.__name__}: {e}'}
+                continue
+
+            results[key] = {
+                'name': name,
+                'n': n,
+                'min': min(times),
+                'median': statistics.median(times),
+                'mean': statistics.fmean(times)
+            }
+
+    for directory in _directories:
+        directory.cleanup()
+
+    _directories.clear()
+
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': results
+    }
+
+def compare(results: dict[str, any], baseline: dict[str, any],
+            threshold: typing.Optional[float] = 0.1) -> list[tuple[str, float, float]]:
+
+    regressions: list[tuple[str, float, float]] = []
+
+    for key, result in results['results'].items():
+        base: typing.Union[BenchmarkResult, None] = baseline['results'].get(key)
+        if not base or 'median' not in base:
+            continue
+
+        if 'error' in result:
+            regressions.append((key, base['median'], math.inf))
+            continue
+
+        if result['median'] > base['median'] * (1 + threshold):
+            regressions.append((key, base['median'], result['median']))
+
+    return regressions
+
+def save(results: dict[str, any], path: str) -> None:
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=4)
+
+def load(path: str) -> dict[str, any]:
+    with open(path, 'r') as f:
+        return json.load(f)
@@ -1 +1,5 @@
+from pge.containers.spatial_grid import SpatialGrid
+from pge.containers.sprite_pool import SpritePool
 from pge.containers.sprite_list import SpriteList
+from pge.containers.particle_emitter import ParticleEmitter
+from pge.containers.tilemap import Tilemap
@@ -0,0 +1,191 @@
+import itertools
+import operator
+import random
+import pygame
+import typing
+import array
+import math
+
+Range = typing.NewType('Range', tuple[float, float])
+
+class ParticleEmitter:
+    REBASE_TIME: typing.Final[float] = 65536.0
+
+    FADE_LEVELS: typing.Final[int] = 16
+    IMAGE_CACHE: typing.Final[int] = 1024
+
+    def __init__(self, image: pygame.Surface, capacity: typing.Optional[int] = 4096,
+                 position: typing.Optional[tuple[float, float]] = (0, 0), rate: typing.Optional[float] = 0.0,
+                 lifetime: typing.Optional[Range] = (30.0, 60.0), speed: typing.Optional[Range] = (1.0, 2.0),
+                 angle: typing.Optional[Range] = (0.0, 360.0), size: typing.Optional[Range] = None,
+                 color: typing.Optional[tuple[float, float, float, float]] = (1.0, 1.0, 1.0, 1.0),
+                 gravity: typing.Optional[tuple[float, float]] = (0.0, 0.0), drag: typing.Optional[float] = 0.0,
+                 fade: typing.Optional[bool] = True, layer: typing.Optional[int] = 0):
+
+        self.image: pygame.Surface = image
+
+        self.position: tuple[float, float] = position
+        self.rate: float = rate
+        self.lifetime: Range = lifetime
+        self.speed: Range = speed
+        self.angle: Range = angle
+        self.size: Range = size or (image.get_width(), image.get_width())
+        self.color: tuple[float, float, float, float] = color
+        self.gravity: tuple[float, float] = gravity
+        self.drag: float = drag
+        self.fade: bool = fade
+        self.layer: int = layer
+
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.time: float = 0.0
+
+        self.x: array.array = array.array('f', bytes(capacity * 4))
+        self.y: array.array = array.array('f', bytes(capacity * 4))
+        self.vx: array.array = array.array('f', bytes(capacity * 4))
+        self.vy: array.array = array.array('f', bytes(capacity * 4))
+        self.birth: array.array = array.array('f', bytes(capacity * 4))
+        self.death: array.array = array.array('f', bytes(capacity * 4))
+        self.sizes: array.array = array.array('f', bytes(capacity * 4))
+        self.colors: array.array = array.array('f', bytes(capacity * 16))
+
+        self._accumulator: float = 0.0
+
+        self._images: dict[tuple[int, tuple[int, int, int, int]], pygame.Surface] = {}
+        self._source: typing.Union[pygame.Surface, None] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _remove(self, index: int) -> None:
+        last: int = self.count - 1
+
+        if index != last:
+            for buffer in (self.x, self.y, self.vx, self.vy, self.birth, self.death, self.sizes):
+                buffer[index] = buffer[last]
+
+            self.colors[index * 4:index * 4 + 4] = self.colors[last * 4:last * 4 + 4]
+
+        self.count = last
+
+    def _rebase(self) -> None:
+        count: int = self.count
+        offset: itertools.repeat = itertools.repeat(self.time)
+
+        self.birth[:count] = array.array('f', map(operator.sub, self.birth[:count], offset))
+        self.death[:count] = array.array('f', map(operator.sub, self.death[:count], offset))
+
+        self.time = 0.0
+
+    def emit(self, count: int, position: typing.Optional[tuple[float, float]] = None) -> int:
+        count = min(count, self.capacity - self.count)
+        x, y = position or self.position
+
+        color: array.array = array.array('f', self.color)
+        uniform: typing.Callable = random.uniform
+
+        for i in range(self.count, self.count + count):
+            angle: float = math.radians(uniform(*self.angle))
+            speed: float = uniform(*self.speed)
+
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = math.cos(angle) * speed
+            self.vy[i] = math.sin(angle) * speed
+            self.birth[i] = self.time
+            self.death[i] = self.time + uniform(*self.lifetime)
+            self.sizes[i] = uniform(*self.size)
+            self.colors[i * 4:i * 4 + 4] = color
+
+        self.count += count
+        return count
+
+    def update(self, delta_time: typing.Optional[float] = 1.0) -> None:
+        self.time += delta_time
+        if self.time > self.REBASE_TIME:
+            self._rebase()
+
+        if self.count:
+            dead: list[int] = list(itertools.compress(range(self.count), map(self.time.__ge__, self.death[:self.count])))
+
+            for i in reversed(dead):
+                self._remove(i)
+
+        if self.rate:
+            self._accumulator += self.rate * delta_time
+            spawn: int = int(self._accumulator)
+
+            if spawn:
+                self._accumulator -= spawn
+                self.emit(spawn)
+
+    def clear(self) -> None:
+        self.count = 0
+        self._accumulator = 0.0
+
+    def get_positions(self) -> tuple[array.array, array.array]:
+        count: int = self.count
+
+        ages: list[float] = list(map(operator.sub, itertools.repeat(self.time, count), self.birth[:count]))
+
+        if self.drag:
+            travel: list[float] = [(1.0 - math.exp(-self.drag * age)) / self.drag for age in ages]
+        else:
+            travel: list[float] = ages
+
+        xs: array.array = array.array('f', map(operator.add, self.x[:count], map(operator.mul, self.vx[:count], travel)))
+        ys: array.array = array.array('f', map(operator.add, self.y[:count], map(operator.mul, self.vy[:count], travel)))
+
+        gx, gy = self.gravity
+        if gx or gy:
+            falls: list[float] = [0.5 * age * age for age in ages]
+
+            xs = array.array('f', map(operator.add, xs, map(operator.mul, falls, itertools.repeat(gx))))
+            ys = array.array('f', map(operator.add, ys, map(operator.mul, falls, itertools.repeat(gy))))
+
+        return xs, ys
+
+    def _get_image(self, size: int, color: tuple[int, int, int, int]) -> pygame.Surface:
+        if self._source is not self.image or len(self._images) > self.IMAGE_CACHE:
+            self._images.clear()
+            self._source = self.image
+
+        key: tuple[int, tuple[int, int, int, int]] = (size, color)
+        if key not in self._images:
+            image: pygame.Surface = pygame.transform.scale(self.image, (size, size)).convert_alpha()
+            image.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+
+            self._images[key] = image
+
+        return self._images[key]
+
+    def render(self, surface: typing.Optional[pygame.Surface] = None, particles: typing.Optional[str] = None) -> None:
+        if particles:
+            from pge.mgl import MGLRenderer, MGLParticles
+            assert MGLRenderer.instanced
+
+            mgl_particles: MGLParticles = MGLRenderer().particles[particles]
+            mgl_particles.draw(self)
+
+            return
+
+        if not self.count:
+            return
+
+        xs, ys = self.get_positions()
+        levels: int = self.FADE_LEVELS
+        colors: array.array = self.colors
+
+        blits: list[tuple[pygame.Surface, tuple[float, float]]] = []
+        for i in range(self.count):
+            size: int = max(1, round(self.sizes[i]))
+            r, g, b, a = (min(255, max(0, round(value * 255))) for value in colors[i * 4:i * 4 + 4])
+
+            if self.fade:
+                life: float = (self.death[i] - self.time) / (self.death[i] - self.birth[i])
+                a = round(a * round(min(1.0, max(0.0, life)) * levels) / levels)
+
+            if a:
+                blits.append((self._get_image(size, (r, g, b, a)), (xs[i] - size / 2, ys[i] - size / 2)))
+
+        surface.fblits(blits)
@@ -0,0 +1,154 @@
+from pge.core import Sprite
+
+import pygame
+import typing
+import math
+
+CellRange = typing.NewType('CellRange', tuple[int, int, int, int])
+
+class SpatialGrid:
+    def __init__(self, cell_size: typing.Optional[int] = 64):
+        self.cell_size: int = cell_size
+
+        self._cells: dict[tuple[int, int], set[Sprite]] = {}
+        self._ranges: dict[Sprite, CellRange] = {}
+        self._rects: dict[Sprite, pygame.FRect] = {}
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, sprite: Sprite) -> bool:
+        return sprite in self._ranges
+
+    def _get_range(self, rect: pygame.FRect) -> CellRange:
+        size: int = self.cell_size
+
+        return (
+            math.floor(rect.left / size), math.floor(rect.top / size),
+            math.floor(rect.right / size), math.floor(rect.bottom / size)
+        )
+
+    def _insert(self, sprite: Sprite, cell_range: CellRange) -> None:
+        for x in range(cell_range[0], cell_range[2] + 1):
+            for y in range(cell_range[1], cell_range[3] + 1):
+                cell: typing.Union[set[Sprite], None] = self._cells.get((x, y))
+                if cell is None:
+                    self._cells[(x, y)] = {sprite}
+                else:
+                    cell.add(sprite)
+
+        self._ranges[sprite] = cell_range
+        self._rects[sprite] = pygame.FRect(sprite.rect)
+
+    def _discard(self, sprite: Sprite, cell_range: CellRange) -> None:
+        for x in range(cell_range[0], cell_range[2] + 1):
+            for y in range(cell_range[1], cell_range[3] + 1):
+                cell: set[Sprite] = self._cells[(x, y)]
+                cell.discard(sprite)
+
+                if not cell:
+                    del self._cells[(x, y)]
+
+    def add(self, sprite: Sprite) -> None:
+        if sprite in self._ranges:
+            self.update(sprite)
+            return
+
+        self._insert(sprite, self._get_range(sprite.rect))
+
+    def remove(self, sprite: Sprite) -> None:
+        cell_range: typing.Union[CellRange, None] = self._ranges.pop(sprite, None)
+        if cell_range is not None:
+            self._rects.pop(sprite)
+            self._discard(sprite, cell_range)
+
+    def update(self, sprite: Sprite) -> None:
+        old_range: CellRange = self._ranges[sprite]
+        new_range: CellRange = self._get_range(sprite.rect)
+
+        if old_range == new_range:
+            self._rects[sprite].update(sprite.rect)
+            return
+
+        self._discard(sprite, old_range)
+        self._insert(sprite, new_range)
+
+    def update_many(self, sprites: typing.Iterable[Sprite]) -> None:
+        ranges: dict[Sprite, CellRange] = self._ranges
+        rects: dict[Sprite, pygame.FRect] = self._rects
+        get_range: typing.Callable = self._get_range
+
+        for sprite in sprites:
+            rect: pygame.FRect = sprite.rect
+            old_rect: pygame.FRect = rects[sprite]
+
+            if rect == old_rect:
+                continue
+
+            old_range: CellRange = ranges[sprite]
+            new_range: CellRange = get_range(rect)
+
+            if old_range != new_range:
+                self._discard(sprite, old_range)
+                self._insert(sprite, new_range)
+            else:
+                old_rect.update(rect)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._ranges.clear()
+        self._rects.clear()
+
+    def query_rect(self, rect: typing.Union[pygame.Rect, pygame.FRect, typing.Sequence[float]]) -> list[Sprite]:
+        rect = pygame.FRect(rect)
+        x0, y0, x1, y1 = self._get_range(rect)
+
+        found: set[Sprite] = set()
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell: typing.Union[set[Sprite], None] = self._cells.get((x, y))
+                if cell:
+                    found.update(cell)
+
+        return [sprite for sprite in found if sprite.rect.colliderect(rect)]
+
+    def query_point(self, point: typing.Sequence[float]) -> list[Sprite]:
+        cell: typing.Union[set[Sprite], None] = self._cells.get(
+            (math.floor(point[0] / self.cell_size), math.floor(point[1] / self.cell_size))
+        )
+
+        if not cell:
+            return []
+
+        return [sprite for sprite in cell if sprite.rect.collidepoint(point)]
+
+    def colliding_pairs(self, mask: typing.Optional[bool] = True) -> list[tuple[Sprite, Sprite]]:
+        pairs: list[tuple[Sprite, Sprite]] = []
+        seen: set[tuple[int, int]] = set()
+
+        for cell in self._cells.values():
+            if len(cell) < 2:
+                continue
+
+            sprites: list[Sprite] = list(cell)
+            for i, a in enumerate(sprites):
+                for b in sprites[i + 1:]:
+                    key: tuple[int, int] = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+                    if key in seen:
+                        continue
+
+                    seen.add(key)
+
+                    if not a.rect.colliderect(b.rect):
+                        continue
+
+                    offset: tuple[int, int] = (
+                        math.floor(b.rect.x) - math.floor(a.rect.x), math.floor(b.rect.y) - math.floor(a.rect.y)
+                    )
+
+                    if mask and not a.mask.overlap(b.mask, offset):
+                        continue
+
+                    pairs.append((a, b))
+
+        return pairs
@@ -1,64 +1,272 @@
-from pge.core import Sprite
+from pge.core import Sprite, Camera
 
+from pge.containers.spatial_grid import SpatialGrid
+from pge.containers.sprite_pool import SpritePool
+
+import operator
+import pygame
 import typing
+import bisect
 
 class SpriteList(list):
     SPRITELIST_DELETE: typing.Final[str] = 'sl_00'
 
+    _LAYER_KEY: typing.Final[typing.Callable] = operator.attrgetter('layer')
+    _RECT_KEY: typing.Final[typing.Callable] = operator.attrgetter('rect')
+
     def _sort_list(self) -> None:
-        self.sort(key = lambda sprite: sprite.layer)
+        self.sort(key = self._LAYER_KEY)
+
+    def _get_layer_range(self, layer: int) -> tuple[int, int]:
+        return (
+            bisect.bisect_left(self, layer, key=self._LAYER_KEY),
+            bisect.bisect_right(self, layer, key=self._LAYER_KEY)
+        )
+
+    def _insert_sorted(self, __object: Sprite, index: typing.Optional[int] = None) -> None:
+        start, stop = self._get_layer_range(__object.layer)
+        if index is None:
+            index = stop
+        else:
+            if index < 0:
+                index = max(0, len(self) + index)
+
+            index = min(max(index, start), stop)
+
+        super().insert(index, __object)
+        __object._sprite_lists[id(self)] = self
+
+    def _detach_sprite(self, __object: Sprite) -> bool:
+        start, stop = self._get_layer_range(__object.layer)
+
+        try:
+            index: int = self.index(__object, start, stop)
+        except ValueError:
+            return False
+
+        super().__delitem__(index)
+        return True
+
+    def _attach_sprite(self, __object: Sprite) -> None:
+        self._insert_sorted(__object)
+
+    def _get_grid(self) -> SpatialGrid:
+        if self._grid is None:
+            self._grid = SpatialGrid(self.cell_size)
+            for __object in self:
+                self._grid.add(__object)
+
+            self._synced = True
+
+        return self._grid
+
+    def _sync_grid(self) -> SpatialGrid:
+        if self._grid is None:
+            return self._get_grid()
+
+        if self.auto_reindex and not self._synced:
+            self.reindex()
+
+        return self._grid
 
     def _get_type_error_message(self, __object: any) -> str:
         return f'{__object} ({__object.__class__.__name__}) not {Sprite.__name__}'
-        
-    def update_all(self, *args: typing.Sequence[any]) -> None:        
+
+    def update_all(self, *args: typing.Sequence[any]) -> None:
         return_value: typing.Union[None, str] = None
         del_sprites: list[Sprite] = []
-        
-        for __object in self:
+
+        self._synced = False
+        for __object in list(self):
             return_value = __object.update(*args)
             if return_value == self.SPRITELIST_DELETE:
                 del_sprites.append(__object)
 
-        for __object in del_sprites:
-            self.remove(__object)
+        if del_sprites:
+            del_ids: set[int] = set(map(id, del_sprites))
+            super().__setitem__(slice(None), [__object for __object in self if id(__object) not in del_ids])
 
-    def render_all(self, *args: typing.Sequence[any]) -> None:      
-        for __object in self:
+            for __object in del_sprites:
+                __object._sprite_lists.pop(id(self), None)
+                if self._grid is not None:
+                    self._grid.remove(__object)
+
+                pool: typing.Union[SpritePool, None] = self.pools.get(type(__object))
+                if pool is not None:
+                    pool.release(__object)
+
+        if self._grid is not None:
+            self.reindex()
+
+    def render_all(self, *args: typing.Sequence[any], batch: typing.Optional[str] = None,
+                   camera: typing.Optional[Camera] = None) -> None:
+
+        sprites: list[Sprite] = self.get_visible(camera) if camera else self
+
+        if batch:
+            from pge.mgl import MGLRenderer, MGLBatch
+            assert MGLRenderer.instanced
+
+            mgl_batch: MGLBatch = MGLRenderer().batches[batch]
+            if camera:
+                mgl_batch.set_camera(camera)
+
+            mgl_batch.draw_sprites(sprites)
+
+            return
+
+        for __object in sprites:
             __object.render(*args)
 
-    def __init__(self, __iterable: typing.Optional[typing.Sequence[Sprite]] = []) -> None:
+    def get_visible(self, camera: Camera) -> list[Sprite]:
+        view: pygame.FRect = camera.view
+
+        if self._grid is not None:
+            candidates: set[Sprite] = set(self._sync_grid().query_rect(view))
+            return [__object for __object in self if __object in candidates]
+
+        return [self[i] for i in view.collidelistall(list(map(self._RECT_KEY, self)))]
+
+    def add_pool(self, pool: SpritePool) -> SpritePool:
+        self.pools[pool.sprite_type] = pool
+        return pool
+
+    def spawn(self, sprite_type: type[Sprite], *args: typing.Sequence[any], **kwargs: dict[str, any]) -> Sprite:
+        pool: typing.Union[SpritePool, None] = self.pools.get(sprite_type)
+        if pool is None:
+            pool = self.add_pool(SpritePool(sprite_type))
+
+        __object: Sprite = pool.acquire(*args, **kwargs)
+        self.append(__object)
+
+        return __object
+
+    def reindex(self) -> None:
+        self._get_grid().update_many(self)
+        self._synced = True
+
+    def query_rect(self, rect: typing.Union[pygame.Rect, pygame.FRect, typing.Sequence[float]]) -> list[Sprite]:
+        return self._sync_grid().query_rect(rect)
+
+    def query_point(self, point: typing.Sequence[float]) -> list[Sprite]:
+        return self._sync_grid().query_point(point)
+
+    def colliding_pairs(self, mask: typing.Optional[bool] = True) -> list[tuple[Sprite, Sprite]]:
+        return self._sync_grid().colliding_pairs(mask)
+
+    def __init__(self, __iterable: typing.Optional[typing.Sequence[Sprite]] = [],
+                 cell_size: typing.Optional[int] = 64) -> None:
+
         for __object in __iterable:
             if not isinstance(__object, Sprite):
                 raise TypeError(f'[SpriteList] __init__ Failed: {self._get_type_error_message(__object)}')
 
         super().__init__(__iterable)
-        
-    def __setitem__(self, index: int, __object: Sprite) -> None:
+        self._sort_list()
+
+        for __object in self:
+            __object._sprite_lists[id(self)] = self
+
+        self.cell_size: int = cell_size
+        self._grid: typing.Union[SpatialGrid, None] = None
+        self.auto_reindex: bool = True
+        self._synced: bool = False
+
+        self.pools: dict[type[Sprite], SpritePool] = {}
+
+    def __setitem__(self, index: typing.Union[int, slice], __object: typing.Union[Sprite, typing.Sequence[Sprite]]) -> None:
+        if isinstance(index, slice):
+            __objects: list[Sprite] = list(__object)
+            for __object in __objects:
+                if not isinstance(__object, Sprite):
+                    raise TypeError(f'[SpriteList] __setitem__ Failed: {self._get_type_error_message(__object)}')
+
+            super().__setitem__(index, __objects)
+            self._sort_list()
+
+            for __object in __objects:
+                __object._sprite_lists[id(self)] = self
+
+            self._grid = None
+            return
+
         if not isinstance(__object, Sprite):
             raise TypeError(f'[SpriteList] __setitem__ Failed: {self._get_type_error_message(__object)}')
 
-        super().__setitem__(index, __object)
-        self._sort_list()
+        old_object: Sprite = super().pop(index)
+        old_object._sprite_lists.pop(id(self), None)
+
+        if self._grid is not None:
+            self._grid.remove(old_object)
+            self._grid.add(__object)
+
+        self._insert_sorted(__object)
+
+    def __delitem__(self, index: typing.Union[int, slice]) -> None:
+        __objects: list[Sprite] = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+
+        for __object in __objects:
+            __object._sprite_lists.pop(id(self), None)
+
+            if self._grid is not None:
+                self._grid.remove(__object)
+
+    def remove(self, __object: Sprite) -> None:
+        if not self._detach_sprite(__object):
+            super().remove(__object)
+
+        __object._sprite_lists.pop(id(self), None)
+
+        if self._grid is not None:
+            self._grid.remove(__object)
+
+    def pop(self, index: typing.Optional[int] = -1) -> Sprite:
+        __object: Sprite = super().pop(index)
+        __object._sprite_lists.pop(id(self), None)
+
+        if self._grid is not None:
+            self._grid.remove(__object)
+
+        return __object
+
+    def clear(self) -> None:
+        for __object in self:
+            __object._sprite_lists.pop(id(self), None)
+
+        super().clear()
+        self._grid = None
 
     def append(self, __object: Sprite) -> None:
         if not isinstance(__object, Sprite):
             raise TypeError(f'[SpriteList] append Failed: {self._get_type_error_message(__object)}')
 
-        super().append(__object)
-        self._sort_list()
+        if self._grid is not None:
+            self._grid.add(__object)
+
+        self._insert_sorted(__object)
 
     def extend(self, __iterable: typing.Sequence[Sprite]) -> None:
-        for __object in __iterable:
+        __objects: list[Sprite] = list(__iterable)
+        for __object in __objects:
             if not isinstance(__object, Sprite):
                 raise TypeError(f'[SpriteList] extend Failed: {self._get_type_error_message(__object)}')
 
-        super().extend(__iterable)
+        if self._grid is not None:
+            for __object in __objects:
+                self._grid.add(__object)
+
+        super().extend(__objects)
         self._sort_list()
 
+        for __object in __objects:
+            __object._sprite_lists[id(self)] = self
+
     def insert(self, index: int, __object: Sprite, ) -> None:
         if not isinstance(__object, Sprite):
             raise TypeError(f'[SpriteList] insert Failed: {self._get_type_error_message(__object)}')
 
-        super().insert(index, __object)
-        self._sort_list()
+        if self._grid is not None:
+            self._grid.add(__object)
+
+        self._insert_sorted(__object, index)
@@ -0,0 +1,65 @@
+from pge.core import Sprite
+
+import typing
+
+T = typing.TypeVar('T', bound=Sprite)
+
+class SpritePool(typing.Generic[T]):
+    def __init__(self, sprite_type: type[T], capacity: typing.Optional[int] = None):
+        if sprite_type.__init__ is not Sprite.__init__ and sprite_type.reset is Sprite.reset:
+            raise TypeError(f'[SpritePool] __init__ Failed: {sprite_type.__name__} defines __init__ but not reset, pooled instances would keep stale state')
+
+        self.sprite_type: type[T] = sprite_type
+        self.capacity: typing.Union[int, None] = capacity
+
+        self._free: list[T] = []
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.released: int = 0
+        self.discarded: int = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'released': self.released,
+            'discarded': self.discarded,
+            'free': len(self._free)
+        }
+
+    def acquire(self, *args: typing.Sequence[any], **kwargs: dict[str, any]) -> T:
+        if self._free:
+            self.hits += 1
+
+            sprite: T = self._free.pop()
+            sprite.reset(*args, **kwargs)
+
+            return sprite
+
+        self.misses += 1
+        return self.sprite_type(*args, **kwargs)
+
+    def release(self, sprite: T) -> bool:
+        if type(sprite) is not self.sprite_type:
+            raise TypeError(f'[SpritePool] release Failed: {sprite} ({sprite.__class__.__name__}) not {self.sprite_type.__name__}')
+
+        if sprite._sprite_lists or (self.capacity is not None and len(self._free) >= self.capacity):
+            self.discarded += 1
+            return False
+
+        self.released += 1
+        self._free.append(sprite)
+
+        return True
+
+    def prefill(self, count: int, *args: typing.Sequence[any], **kwargs: dict[str, any]) -> None:
+        for _ in range(count):
+            self._free.append(self.sprite_type(*args, **kwargs))
+
+    def clear(self) -> None:
+        self._free.clear()
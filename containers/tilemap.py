@@ -0,0 +1,217 @@
+from pge.core import Camera
+
+import collections
+import itertools
+import pygame
+import typing
+import array
+import math
+
+ChunkKey = typing.NewType('ChunkKey', tuple[int, int])
+
+class Tilemap:
+    EMPTY: typing.Final[int] = -1
+    MEMORY_BUDGET: typing.Final[int] = 64 * 1024 * 1024
+
+    def __init__(self, tiles: typing.Sequence[pygame.Surface], dimensions: tuple[int, int],
+                 chunk_size: typing.Optional[int] = 16, position: typing.Optional[tuple[float, float]] = (0, 0)):
+
+        self.tiles: list[pygame.Surface] = list(tiles)
+        self.tile_size: tuple[int, int] = self.tiles[0].get_size()
+
+        self.dimensions: tuple[int, int] = dimensions
+        self.chunk_size: int = chunk_size
+        self.position: tuple[float, float] = position
+
+        self.data: array.array = array.array('h', [self.EMPTY]) * (dimensions[0] * dimensions[1])
+
+        self.budget: int = self.MEMORY_BUDGET
+        self.bakes: int = 0
+
+        self._chunks: collections.OrderedDict[ChunkKey, typing.Union[pygame.Surface, None]] = collections.OrderedDict()
+        self._scaled: dict[ChunkKey, tuple[float, pygame.Surface]] = {}
+        self._size: int = 0
+
+    @property
+    def chunk_dimensions(self) -> tuple[int, int]:
+        return (
+            -(-self.dimensions[0] // self.chunk_size),
+            -(-self.dimensions[1] // self.chunk_size)
+        )
+
+    @property
+    def pixel_size(self) -> tuple[int, int]:
+        return (self.chunk_size * self.tile_size[0], self.chunk_size * self.tile_size[1])
+
+    def _discard_scaled(self, key: ChunkKey) -> None:
+        scaled: typing.Union[tuple[float, pygame.Surface], None] = self._scaled.pop(key, None)
+        if scaled:
+            self._size -= scaled[1].get_width() * scaled[1].get_height() * scaled[1].get_bytesize()
+
+    def _invalidate(self, key: ChunkKey) -> None:
+        self._discard_scaled(key)
+
+        chunk: typing.Union[pygame.Surface, None] = self._chunks.pop(key, None)
+        if chunk:
+            self._size -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+    def _evict(self) -> None:
+        while self._size > self.budget and len(self._chunks) > 1:
+            key, chunk = self._chunks.popitem(last=False)
+            self._discard_scaled(key)
+
+            if chunk:
+                self._size -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
+    def _bake(self, key: ChunkKey) -> typing.Union[pygame.Surface, None]:
+        columns, rows = self.dimensions
+        tile_width, tile_height = self.tile_size
+
+        x_0: int = key[0] * self.chunk_size
+        y_0: int = key[1] * self.chunk_size
+        x_1: int = min(x_0 + self.chunk_size, columns)
+
+        blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for y in range(y_0, min(y_0 + self.chunk_size, rows)):
+            row: array.array = self.data[y * columns + x_0:y * columns + x_1]
+
+            for x, index in enumerate(row):
+                if index != self.EMPTY:
+                    blits.append((self.tiles[index], (x * tile_width, (y - y_0) * tile_height)))
+
+        self.bakes += 1
+
+        if not blits:
+            return None
+
+        chunk: pygame.Surface = pygame.Surface(self.pixel_size, pygame.SRCALPHA)
+        chunk.fblits(blits)
+
+        self._size += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+        return chunk
+
+    def get_chunk(self, key: ChunkKey) -> typing.Union[pygame.Surface, None]:
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return self._chunks[key]
+
+        chunk: typing.Union[pygame.Surface, None] = self._bake(key)
+
+        self._chunks[key] = chunk
+        self._evict()
+
+        return chunk
+
+    def _check_bounds(self, x: int, y: int, method: str) -> None:
+        if not (0 <= x < self.dimensions[0] and 0 <= y < self.dimensions[1]):
+            raise IndexError(f'[Tilemap] {method} Failed: tile ({x}, {y}) outside {self.dimensions}')
+
+    def get_scaled_chunk(self, key: ChunkKey, zoom: float) -> typing.Union[pygame.Surface, None]:
+        chunk: typing.Union[pygame.Surface, None] = self.get_chunk(key)
+        if not chunk or zoom == 1.0:
+            return chunk
+
+        scaled: typing.Union[tuple[float, pygame.Surface], None] = self._scaled.get(key)
+        if scaled and scaled[0] == zoom:
+            return scaled[1]
+
+        self._discard_scaled(key)
+
+        chunk_width, chunk_height = self.pixel_size
+        surface: pygame.Surface = pygame.transform.scale(chunk, (math.ceil(chunk_width * zoom), math.ceil(chunk_height * zoom)))
+
+        self._scaled[key] = (zoom, surface)
+        self._size += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self._evict()
+
+        return surface
+
+    def get_tile(self, x: int, y: int) -> int:
+        self._check_bounds(x, y, 'get_tile')
+        return self.data[y * self.dimensions[0] + x]
+
+    def set_tile(self, x: int, y: int, index: int) -> None:
+        self._check_bounds(x, y, 'set_tile')
+
+        position: int = y * self.dimensions[0] + x
+        if self.data[position] == index:
+            return
+
+        self.data[position] = index
+        self._invalidate((x // self.chunk_size, y // self.chunk_size))
+
+    def fill(self, rect: typing.Union[pygame.Rect, typing.Sequence[int]], index: int) -> None:
+        x, y, width, height = pygame.Rect(rect).clip((0, 0, *self.dimensions))
+        if not width or not height:
+            return
+
+        columns: int = self.dimensions[0]
+
+        row: array.array = array.array('h', [index]) * width
+        for ty in range(y, y + height):
+            self.data[ty * columns + x:ty * columns + x + width] = row
+
+        for cy in range(y // self.chunk_size, (y + height - 1) // self.chunk_size + 1):
+            for cx in range(x // self.chunk_size, (x + width - 1) // self.chunk_size + 1):
+                self._invalidate((cx, cy))
+
+    def load(self, data: typing.Sequence[typing.Sequence[int]]) -> None:
+        columns, rows = self.dimensions
+
+        if len(data) > rows:
+            raise ValueError(f'[Tilemap] load Failed: {len(data)} rows for a map {rows} tiles high')
+
+        for y, row in enumerate(data):
+            if len(row) > columns:
+                raise ValueError(f'[Tilemap] load Failed: row {y} has {len(row)} tiles for a map {columns} tiles wide')
+
+        for y, row in enumerate(data):
+            self.data[y * columns:y * columns + len(row)] = array.array('h', row)
+
+        self.clear()
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._scaled.clear()
+        self._size = 0
+
+    def get_visible(self, camera: typing.Union[pygame.Rect, pygame.FRect, typing.Sequence[float]]) -> list[ChunkKey]:
+        x, y, width, height = camera
+        chunk_width, chunk_height = self.pixel_size
+        columns, rows = self.chunk_dimensions
+
+        x -= self.position[0]
+        y -= self.position[1]
+
+        return list(itertools.product(
+            range(max(0, int(x // chunk_width)), min(columns, int((x + width) // chunk_width) + 1)),
+            range(max(0, int(y // chunk_height)), min(rows, int((y + height) // chunk_height) + 1))
+        ))
+
+    def render(self, surface: pygame.Surface,
+               camera: typing.Optional[typing.Union[Camera, pygame.Rect, pygame.FRect, typing.Sequence[float]]] = None) -> None:
+
+        if camera is None:
+            camera = (0, 0, *surface.get_size())
+
+        if isinstance(camera, Camera):
+            view: typing.Union[pygame.FRect, typing.Sequence[float]] = camera.view
+            zoom: float = camera.zoom
+            offset_x, offset_y = camera.world_to_screen(self.position)
+        else:
+            view: typing.Union[pygame.Rect, pygame.FRect, typing.Sequence[float]] = camera
+            zoom: float = 1.0
+            offset_x: float = self.position[0] - camera[0]
+            offset_y: float = self.position[1] - camera[1]
+
+        chunk_width, chunk_height = self.pixel_size
+
+        blits: list[tuple[pygame.Surface, tuple[float, float]]] = []
+        for key in self.get_visible(view):
+            chunk: typing.Union[pygame.Surface, None] = self.get_scaled_chunk(key, zoom)
+            if not chunk:
+                continue
+
+            blits.append((chunk, (key[0] * chunk_width * zoom + offset_x, key[1] * chunk_height * zoom + offset_y)))
+
+        surface.fblits(blits)
@@ -1,4 +1,6 @@
+from pge.core.assets import Assets
 from pge.core.sprite import Sprite
+from pge.core.camera import Camera
 from pge.core.input import Input
 from pge.core.sound import Sound
 from pge.core.font import Font
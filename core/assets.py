@@ -0,0 +1,185 @@
+from pge.types import Singleton
+from pge.utils import scale, load_spritesheet
+
+import concurrent.futures
+import collections
+import pygame
+import typing
+
+AssetKey = typing.NewType('AssetKey', tuple[str, float, typing.Union[None, tuple[int, int, int]]])
+ManifestEntry = typing.NewType('ManifestEntry', typing.Union[str, typing.Sequence[any]])
+
+@Singleton
+class Assets:
+    MEMORY_BUDGET: typing.Final[int] = 256 * 1024 * 1024
+
+    class Preload:
+        def __init__(self, keys: list[AssetKey], callback: typing.Union[None, typing.Callable]):
+            self.keys: list[AssetKey] = keys
+            self.paths: set[str] = set(key[0] for key in keys)
+            self.callback: typing.Union[None, typing.Callable] = callback
+
+            self.loaded: int = 0
+
+        @property
+        def total(self) -> int:
+            return len(self.paths)
+
+        @property
+        def done(self) -> bool:
+            return self.loaded >= self.total
+
+    def __init__(self):
+        self._images: collections.OrderedDict[AssetKey, pygame.Surface] = collections.OrderedDict()
+        self._sheets: collections.OrderedDict[tuple, list[pygame.Surface]] = collections.OrderedDict()
+        self._size: int = 0
+
+        self._pending: dict[str, concurrent.futures.Future] = {}
+        self._preloads: list[Assets.Preload] = []
+
+        self._executor: typing.Union[concurrent.futures.ThreadPoolExecutor, None] = None
+
+        self.budget: int = self.MEMORY_BUDGET
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __del__(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _get_size(images: typing.Sequence[pygame.Surface]) -> int:
+        return sum(image.get_width() * image.get_height() * image.get_bytesize() for image in set(images))
+
+    def _evict(self) -> None:
+        while self._size > self.budget and (self._images or self._sheets):
+            if self._images:
+                _, image = self._images.popitem(last=False)
+                self._size -= self._get_size([image])
+            else:
+                _, images = self._sheets.popitem(last=False)
+                self._size -= self._get_size(images)
+
+    def _store(self, key: AssetKey, image: pygame.Surface) -> pygame.Surface:
+        image = scale(image, key[1])
+        if key[2]:
+            image.set_colorkey(key[2])
+
+        self._images[key] = image
+        self._size += self._get_size([image])
+        self._evict()
+
+        return image
+
+    def _complete(self, path: str) -> pygame.Surface:
+        image: pygame.Surface = self._pending.pop(path).result()
+
+        for preload in self._preloads:
+            if path not in preload.paths:
+                continue
+
+            for key in preload.keys:
+                if key[0] == path and key not in self._images:
+                    self._store(key, image)
+
+            preload.loaded += 1
+            if preload.callback:
+                preload.callback(preload.loaded, preload.total, path)
+
+        self._preloads = [preload for preload in self._preloads if not preload.done]
+        return image
+
+    def _run(self) -> None:
+        for path, future in list(self._pending.items()):
+            if future.done():
+                self._complete(path)
+
+    @staticmethod
+    def _copy(images: list[pygame.Surface]) -> list[pygame.Surface]:
+        copies: dict[int, pygame.Surface] = {}
+        for image in images:
+            if id(image) not in copies:
+                copies[id(image)] = image.copy()
+
+        return [copies[id(image)] for image in images]
+
+    def _load(self, path: str, image_scale: float, colorkey: typing.Union[None, tuple[int, int, int]]) -> pygame.Surface:
+        key: AssetKey = (path, image_scale, colorkey)
+        if key in self._images:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return self._images[key]
+
+        self.misses += 1
+
+        if path in self._pending:
+            self._complete(path)
+
+            if key in self._images:
+                return self._images[key]
+
+        return self._store(key, pygame.image.load(path))
+
+    # returned surfaces are shared between callers and must be treated as read-only; pass copy=True to draw onto one
+    def load(self, path: str, image_scale: typing.Optional[float] = 1,
+             colorkey: typing.Optional[tuple[int, int, int]] = (0, 0, 0),
+             copy: typing.Optional[bool] = False) -> pygame.Surface:
+
+        image: pygame.Surface = self._load(path, image_scale, colorkey)
+        return image.copy() if copy else image
+
+    def load_spritesheet(self, path: str, frames: typing.Optional[typing.Sequence[int]] = None,
+                         colorkey: typing.Optional[tuple[int, int, int]] = (0, 0, 0),
+                         image_scale: typing.Optional[float] = 1.0,
+                         copy: typing.Optional[bool] = False) -> list[pygame.Surface]:
+
+        key: tuple = (path, tuple(frames) if frames else None, colorkey, image_scale)
+        if key in self._sheets:
+            self.hits += 1
+            self._sheets.move_to_end(key)
+            return self._copy(self._sheets[key]) if copy else list(self._sheets[key])
+
+        self.misses += 1
+
+        images: list[pygame.Surface] = load_spritesheet(self._load(path, 1, None), frames, colorkey, image_scale, cache_path=path)
+
+        self._sheets[key] = images
+        self._size += self._get_size(images)
+        self._evict()
+
+        return self._copy(images) if copy else list(images)
+
+    def preload(self, manifest: typing.Sequence[ManifestEntry], callback: typing.Optional[typing.Callable] = None,
+                workers: typing.Optional[int] = None) -> Preload:
+
+        if not self._executor:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pge-assets')
+
+        keys: list[AssetKey] = []
+        for entry in manifest:
+            entry = (entry,) if isinstance(entry, str) else tuple(entry)
+            path, image_scale, colorkey = entry + (1, (0, 0, 0))[len(entry) - 1:]
+
+            keys.append((path, image_scale, tuple(colorkey) if colorkey else None))
+
+        preload: Assets.Preload = self.Preload(keys, callback)
+
+        for path in preload.paths:
+            if path in self._pending:
+                continue
+
+            if all(key in self._images for key in keys if key[0] == path):
+                preload.loaded += 1
+                continue
+
+            self._pending[path] = self._executor.submit(pygame.image.load, path)
+
+        if not preload.done:
+            self._preloads.append(preload)
+
+        return preload
+
+    def clear(self) -> None:
+        self._images.clear()
+        self._sheets.clear()
+        self._size = 0
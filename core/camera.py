@@ -0,0 +1,49 @@
+import pygame
+import typing
+
+class Camera:
+    def __init__(self, viewport: typing.Union[pygame.Rect, typing.Sequence[int]],
+                 position: typing.Optional[pygame.Vector2] = pygame.Vector2(0, 0), zoom: typing.Optional[float] = 1.0):
+
+        self.viewport: pygame.Rect = pygame.Rect(viewport)
+        self.position: pygame.Vector2 = pygame.Vector2(position)
+        self.zoom: float = zoom
+
+        self.margin: float = 0.0
+
+    @property
+    def view(self) -> pygame.FRect:
+        return pygame.FRect(
+            self.position.x - self.margin, self.position.y - self.margin,
+            self.viewport.w / self.zoom + self.margin * 2, self.viewport.h / self.zoom + self.margin * 2
+        )
+
+    @property
+    def center(self) -> pygame.Vector2:
+        return self.position + pygame.Vector2(self.viewport.w, self.viewport.h) / (2 * self.zoom)
+
+    @center.setter
+    def center(self, value: typing.Sequence[float]) -> None:
+        self.position = pygame.Vector2(value) - pygame.Vector2(self.viewport.w, self.viewport.h) / (2 * self.zoom)
+
+    def is_visible(self, rect: typing.Union[pygame.Rect, pygame.FRect, typing.Sequence[float]]) -> bool:
+        return self.view.colliderect(rect)
+
+    def world_to_screen(self, point: typing.Sequence[float]) -> pygame.Vector2:
+        return pygame.Vector2(
+            (point[0] - self.position.x) * self.zoom + self.viewport.x,
+            (point[1] - self.position.y) * self.zoom + self.viewport.y
+        )
+
+    def screen_to_world(self, point: typing.Sequence[float]) -> pygame.Vector2:
+        return pygame.Vector2(
+            (point[0] - self.viewport.x) / self.zoom + self.position.x,
+            (point[1] - self.viewport.y) / self.zoom + self.position.y
+        )
+
+    def apply(self, rect: typing.Union[pygame.Rect, pygame.FRect]) -> pygame.FRect:
+        return pygame.FRect(
+            (rect[0] - self.position.x) * self.zoom + self.viewport.x,
+            (rect[1] - self.position.y) * self.zoom + self.viewport.y,
+            rect[2] * self.zoom, rect[3] * self.zoom
+        )
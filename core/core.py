@@ -1,37 +1,93 @@
-from pge import OPENGL, MOUSE
+from pge import OPENGL, MOUSE, HEADLESS, startup_times
 
 from pge.types import Singleton
 
-from pge.utils import clamp
-
-from pge.mgl import MGLRenderer
+from pge.utils import clamp, Profiler
 
+from pge.core import Assets
 from pge.core import Input
 from pge.core import Font
 from pge.core import Sound
 
+from pge.core.replay import InputLog
+
 import pygame
 import typing
 import time
+import os
+
+if typing.TYPE_CHECKING:
+    from pge.mgl import MGLRenderer
+
+class _NullProfiler:
+    enabled: bool = False
+
+    def begin(self, name: str) -> None:
+        ...
+
+    def end(self, name: str) -> None:
+        ...
+
+    def _run(self) -> None:
+        ...
 
 @Singleton
 class Core:
+    _NULL_PROFILER: typing.Final[_NullProfiler] = _NullProfiler()
+
     @Singleton
     class Services:
-        def __init__(self):
-            self.inputs: Input = Input()
-            self.fonts: Font = Font()
-            self.sounds: Sound = Sound()
+        @staticmethod
+        def _get(name: str, service: Singleton) -> typing.Any:
+            if not service.instanced:
+                start: float = time.perf_counter()
+                service()
+                startup_times[f'services.{name}'] = time.perf_counter() - start
+
+            return service()
+
+        @property
+        def inputs(self) -> Input:
+            return self._get('inputs', Input)
+
+        @property
+        def fonts(self) -> Font:
+            return self._get('fonts', Font)
+
+        @property
+        def sounds(self) -> Sound:
+            return self._get('sounds', Sound)
+
+        @property
+        def assets(self) -> Assets:
+            return self._get('assets', Assets)
+
+        @property
+        def profiler(self) -> Profiler:
+            return self._get('profiler', Profiler)
+
+        def _run(self) -> None:
+            if Assets.instanced:
+                Assets()._run()
+
+            if Sound.instanced:
+                Sound()._run()
 
     def __init__(self, title: str, screen_dimensions: tuple[int, int], frame_rate: int,
                  pygame_flags: typing.Optional[int] = 0, pge_flags: typing.Optional[int] = 0):
 
-        if pge_flags & OPENGL:
+        if pge_flags & HEADLESS:
+            pygame_flags |= pygame.HIDDEN
+        elif pge_flags & OPENGL:
             pygame_flags |= (pygame.OPENGL | pygame.DOUBLEBUF)
 
+        start: float = time.perf_counter()
+
         pygame.init()
         pygame.mixer.init()
 
+        startup_times['core.pygame'] = time.perf_counter() - start
+
         pygame.display.set_caption(title)
         pygame.mouse.set_visible(True if pge_flags & MOUSE else False)
 
@@ -42,21 +98,38 @@ def __init__(self, title: str, screen_dimensions: tuple[int, int], frame_rate: i
 
         self.quit: bool = False
 
+        start = time.perf_counter()
+
         self.screen: pygame.Surface = pygame.display.set_mode(screen_dimensions, pygame_flags)
         self.screen_color: tuple[int, int, int] = (0, 0, 0)
 
+        startup_times['core.display'] = time.perf_counter() - start
+
         self.opengl: bool = True if pge_flags & OPENGL else False
         self.mgl: MGLRenderer = None
 
         if self.opengl:
-            self.mgl: MGLRenderer = MGLRenderer(screen_dimensions)
+            start = time.perf_counter()
+
+            from pge.mgl import MGLRenderer
+            if pge_flags & HEADLESS:
+                self.mgl: MGLRenderer = MGLRenderer(screen_dimensions, standalone=True, backend=os.environ.get('PGE_GL_BACKEND'))
+            else:
+                self.mgl: MGLRenderer = MGLRenderer(screen_dimensions)
+
+            startup_times['core.mgl'] = time.perf_counter() - start
 
         self.clock: pygame.Clock = pygame.time.Clock()
 
-        self.delta_time: float = time.time()
-        self.last_time: float = time.time()
+        self.delta_time: float = 1.0
+        self.last_time: float = time.perf_counter()
         self.delta_time_threshold: typing.Union[float, None] = None
 
+        self.tick_rate: typing.Union[int, None] = None
+        self.max_ticks: int = 5
+        self.accumulator: float = 0.0
+        self.alpha: float = 1.0
+
         self.frame_count: float = 0
 
         self.events: list[pygame.Event] = None
@@ -67,25 +140,121 @@ def __del__(self) -> None:
         pygame.mixer.quit()
         pygame.quit()
 
-    def run(self, func: typing.Optional[typing.Callable] = None, *args: typing.Sequence[any]) -> None:
+    def _tick(self, func: typing.Union[typing.Callable, None], *args: typing.Sequence[any]) -> None:
+        self.frame_count += 1 * self.delta_time
+
+        if func:
+            profiler: typing.Union[Profiler, _NullProfiler] = self._get_profiler()
+
+            profiler.begin('core.update')
+            func(*args)
+            profiler.end('core.update')
+
+    def _get_profiler(self) -> typing.Union[Profiler, _NullProfiler]:
+        return Profiler() if Profiler.instanced else self._NULL_PROFILER
+
+    def run(self, func: typing.Optional[typing.Callable] = None, *args: typing.Sequence[any],
+            render_func: typing.Optional[typing.Callable] = None) -> None:
+
+        self.last_time = time.perf_counter()
+
         while not self.quit:
+            profiler: typing.Union[Profiler, _NullProfiler] = self._get_profiler()
+            profiler.begin('core.frame')
+
+            profiler.begin('core.events')
             self.events = pygame.event.get()
+            profiler.end('core.events')
+
+            profiler.begin('core.input')
             self.quit = self.services.inputs._run(self.events)
-            
-            self.delta_time = (time.time() - self.last_time) * self.frame_rate
-            self.last_time = time.time()
+            profiler.end('core.input')
+
+            self.services._run()
+
+            current_time: float = time.perf_counter()
+            frame_time: float = current_time - self.last_time
+            self.last_time = current_time
+
+            if self.tick_rate:
+                step: float = 1 / self.tick_rate
+                self.delta_time = self.frame_rate / self.tick_rate
+                self.accumulator += frame_time
+
+                ticks: int = 0
+                while self.accumulator >= step and ticks < self.max_ticks:
+                    self._tick(func, *args)
+
+                    self.accumulator -= step
+                    ticks += 1
+
+                if ticks == self.max_ticks:
+                    self.accumulator %= step
+
+                self.alpha = self.accumulator / step
+
+            else:
+                self.delta_time = frame_time * self.frame_rate
+
+                if self.delta_time_threshold:
+                    self.delta_time = clamp(self.delta_time, 0, self.delta_time_threshold)
+
+                self._tick(func, *args)
+                self.alpha = 1.0
+
+                ticks: int = 1
 
-            if self.delta_time_threshold:
-                self.delta_time = clamp(self.delta_time, 0, self.delta_time_threshold)
+            self.services.inputs._end_frame(ticks, self.delta_time)
 
-            self.frame_count += 1 * self.delta_time
-            
-            if func:
-                func(*args)
+            if render_func:
+                profiler.begin('core.render')
+                render_func(self.alpha)
+                profiler.end('core.render')
+
+            if profiler.enabled and profiler.overlay and not self.opengl:
+                profiler.render(self.screen)
 
             if self.opengl:
+                profiler.begin('core.mgl')
                 self.mgl.render()
+                profiler.end('core.mgl')
 
+            profiler.begin('core.flip')
             pygame.display.flip()
+            profiler.end('core.flip')
+
+            profiler.end('core.frame')
+            profiler._run()
 
             self.clock.tick(self.frame_rate)
+
+        if self.opengl and self.mgl.capture:
+            self.mgl.stop_capture()
+
+    def replay(self, path: str, func: typing.Optional[typing.Callable] = None, *args: typing.Sequence[any],
+               render_func: typing.Optional[typing.Callable] = None) -> int:
+
+        log: InputLog = InputLog(path)
+        inputs: Input = self.services.inputs
+
+        frames: int = 0
+        for ticks, delta_time, held, pressed, released, keys in log.remap(inputs.get_actions()):
+            if self.quit:
+                break
+
+            inputs._apply_frame(held, pressed, released, keys)
+
+            self.services._run()
+
+            self.delta_time = delta_time
+            for _ in range(ticks):
+                self._tick(func, *args)
+
+            inputs._end_frame(ticks, delta_time)
+
+            if render_func:
+                render_func(1.0)
+
+            frames += 1
+
+        return frames
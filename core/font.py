@@ -1,60 +1,134 @@
+from pge import startup_times
+
 from pge.types import Singleton
 from pge.utils import load_spritesheet
 
+import collections
 import pygame
 import typing
+import time
 import os
 
+GlyphAtlas = typing.NewType('GlyphAtlas', tuple[pygame.Surface, dict[str, pygame.Rect]])
+
 @Singleton
 class Font:
-    _FONT_PATH: typing.Final[str] = os.path.join('pge', '_resources', 'fonts')
-    _FONT_KEYS: typing.Final[tuple[str]] = tuple(map(str, 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890!?,.;:\'\"/|\_()[]{}<>@#$%+-*=^&')) 
+    _FONT_PATH: typing.Final[str] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '_resources', 'fonts')
+    _FONT_KEYS: typing.Final[tuple[str]] = tuple(map(str, 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890!?,.;:\'\"/|\_()[]{}<>@#$%+-*=^&'))
+
+    CACHE_BUDGET: typing.Final[int] = 4 * 1024 * 1024
 
     def __init__(self):
         self._fonts: dict[str, typing.Union[int, dict[chr, pygame.Surface]]] = {
             'm3x6': {
                 'spacing': 1,
                 'letters': {}
-            } 
+            }
         }
 
-        for file in os.listdir(self._FONT_PATH):
-            name: str = file.split('.')[0]
-            images: list[pygame.Surface] = load_spritesheet(os.path.join(self._FONT_PATH, file))
+        self._atlases: dict[tuple[str, int, tuple[int, int, int]], GlyphAtlas] = {}
 
-            for index, key in enumerate(self._FONT_KEYS):
-                self._fonts[name]['letters'][key] = images[index]
+        self._cache: collections.OrderedDict[tuple, pygame.Surface] = collections.OrderedDict()
+        self._cache_size: int = 0
 
-    def create(self, text: str, font: typing.Optional[str] = 'm3x6', size: typing.Optional[int] = 1, 
-               color: typing.Optional[tuple[int, int, int]] = (255, 255, 255)) -> pygame.Surface:
+        self.cache_budget: int = self.CACHE_BUDGET
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
 
-        surface_size: list[int] = [0, 0]
-        images: list[pygame.Surface] = []
+    def _get_letters(self, font: str) -> dict[str, pygame.Surface]:
+        letters: dict[str, pygame.Surface] = self._fonts[font]['letters']
+        if letters:
+            return letters
 
-        for letter in str(text):
-            image: pygame.Surface = None
+        start: float = time.perf_counter()
+        images: list[pygame.Surface] = load_spritesheet(os.path.join(self._FONT_PATH, f'{font}.png'))
 
-            if letter == ' ':
-                image = pygame.Surface((self._fonts[font]['spacing'] * 2, self._fonts[font]['letters']['a'].get_height())).convert_alpha()
-                image.set_colorkey((0, 0, 0))
-            else:
-                image = self._fonts[font]['letters'][letter].copy()
+        for index, key in enumerate(self._FONT_KEYS):
+            letters[key] = images[index]
+
+        startup_times[f'font.{font}'] = time.perf_counter() - start
+        return letters
+
+    def _get_atlas(self, font: str, size: int, color: tuple[int, int, int]) -> GlyphAtlas:
+        key: tuple[str, int, tuple[int, int, int]] = (font, size, color)
+        if key in self._atlases:
+            return self._atlases[key]
+
+        letters: dict[str, pygame.Surface] = self._get_letters(font)
+
+        width: int = sum(image.get_width() for image in letters.values())
+        height: int = max(image.get_height() for image in letters.values())
+
+        strip: pygame.Surface = pygame.Surface((width, height)).convert_alpha()
+        strip.fill((0, 0, 0, 0))
+
+        rects: dict[str, pygame.Rect] = {}
+
+        x: int = 0
+        for letter, image in letters.items():
+            strip.blit(image, (x, 0))
+            rects[letter] = pygame.Rect(x * size, 0, image.get_width() * size, image.get_height() * size)
+            x += image.get_width()
 
-            surface_size[0] += (image.get_width() + self._fonts[font]['spacing'])
-            if image.get_height() > surface_size[1]:
-                surface_size[1] += image.get_height()
+        strip = pygame.transform.scale(strip, (width * size, height * size)).convert_alpha()
+        strip = pygame.mask.from_surface(strip).to_surface(setcolor=color, unsetcolor=(0, 0, 0)).convert_alpha()
+        strip.set_colorkey((0, 0, 0))
 
-            image = pygame.transform.scale(image, (image.get_width() * size, image.get_height() * size)).convert_alpha()
-            image = pygame.mask.from_surface(image).to_surface(setcolor=color, unsetcolor=(0, 0, 0)).convert_alpha()
+        self._atlases[key] = (strip, rects)
+        return self._atlases[key]
 
-            images.append(image)
+    def _cache_surface(self, key: tuple, surface: pygame.Surface) -> None:
+        self._cache[key] = surface
+        self._cache_size += surface.get_width() * surface.get_height() * surface.get_bytesize()
 
-        surface: pygame.Surface = pygame.Surface((surface_size[0] * size, surface_size[1] * size)).convert_alpha()
+        while self._cache_size > self.cache_budget and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_size -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+
+    def clear_cache(self) -> None:
+        self._atlases.clear()
+        self._cache.clear()
+        self._cache_size = 0
+
+    def sanitize(self, text: str, replacement: typing.Optional[str] = '?') -> str:
+        return ''.join(letter if letter == ' ' or letter in self._FONT_KEYS else replacement for letter in str(text))
+
+    def create(self, text: str, font: typing.Optional[str] = 'm3x6', size: typing.Optional[int] = 1,
+               color: typing.Optional[tuple[int, int, int]] = (255, 255, 255)) -> pygame.Surface:
+
+        text = str(text)
+        color = tuple(color)
+
+        key: tuple[str, str, int, tuple[int, int, int]] = (text, font, size, color)
+        if key in self._cache:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key].copy()
+
+        self.cache_misses += 1
+
+        atlas, rects = self._get_atlas(font, size, color)
+        spacing: int = self._fonts[font]['spacing']
+        height: int = self._get_letters(font)['a'].get_height()
+
+        width: int = 0
+        for letter in text:
+            if letter == ' ':
+                width += spacing * 2 + spacing
+            else:
+                width += rects[letter].width // size + spacing
+
+        surface: pygame.Surface = pygame.Surface((width * size, height * size)).convert_alpha()
         surface.set_colorkey((0, 0, 0))
 
         x: int = 0
-        for image, letter in zip(images, str(text)):
-            surface.blit(image, (x, 0))
-            x += image.get_width() + (self._fonts[font]['spacing'] * size)
+        for letter in text:
+            if letter == ' ':
+                x += (spacing * 2 + spacing) * size
+                continue
+
+            surface.blit(atlas, (x, 0), rects[letter])
+            x += rects[letter].width + (spacing * size)
 
-        return surface
+        self._cache_surface(key, surface)
+        return surface.copy()
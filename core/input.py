@@ -1,90 +1,297 @@
 from pge.types import Singleton
 
+from pge.core.replay import InputRecorder
+
+import inspect
 import pygame
 import typing
 
-FuncInfo = typing.NewType('FuncInfo', tuple[typing.Sequence[any], typing.Union[None, int, typing.Sequence[int]]])
+FuncInfo = typing.NewType('FuncInfo', tuple[int, typing.Sequence[any], bool])
 
 @Singleton
 class Input:
+    WILDCARD: typing.Final[None] = None
+
+    _EVENT_KEYS: typing.Final[dict[int, typing.Union[str, None]]] = {
+        pygame.KEYDOWN: 'key',
+        pygame.KEYUP: 'key',
+        pygame.MOUSEBUTTONDOWN: 'button',
+        pygame.MOUSEBUTTONUP: 'button',
+        pygame.MOUSEMOTION: None,
+        pygame.MOUSEWHEEL: None,
+        pygame.JOYBUTTONDOWN: 'button',
+        pygame.JOYBUTTONUP: 'button',
+        pygame.JOYAXISMOTION: 'axis',
+        pygame.JOYHATMOTION: 'hat',
+        pygame.TEXTINPUT: None
+    }
+
+    _ACTION_EVENTS: typing.Final[dict[int, int]] = {
+        pygame.KEYDOWN: pygame.KEYDOWN,
+        pygame.KEYUP: pygame.KEYDOWN,
+        pygame.MOUSEBUTTONDOWN: pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP: pygame.MOUSEBUTTONDOWN,
+        pygame.JOYBUTTONDOWN: pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP: pygame.JOYBUTTONDOWN
+    }
+
+    _KEY_COUNT: typing.Final[int] = 512
+
     def __init__(self):
         self.pressed: pygame.key.ScancodeWrapper = None
 
-        self._keydown_funcs: dict[callable, FuncInfo] = {}
-        self._keyup_funcs: dict[callable, FuncInfo] = {}
-
-        self._itering = False
-        self._del_funcs: dict[int, list[callable]] = {
-            pygame.KEYDOWN: [],
-            pygame.KEYUP: []
+        self._handlers: dict[int, dict[typing.Union[int, None], dict[callable, FuncInfo]]] = {
+            key_type: {} for key_type in self._EVENT_KEYS
         }
 
-    def _iter_funcs(self, event: pygame.Event, funcs: dict[callable, FuncInfo]) -> None:
-        self._itering = True
-
-        key: int = event.key
-        for func, info in funcs.items():
-            if isinstance(info[1], typing.Sequence):
-                if key in info[1]:
-                    try:
-                        func(*info[0], event)
-                    except TypeError:
-                        func(*info[0])    
-        
-            elif not info[1] or info[1] == key:
-                try:
-                    func(*info[0], event)
-                except TypeError:
-                    func(*info[0])    
-
-        self._itering = False
-
-        for key_type, funcs in self._del_funcs.items():
-            for func in funcs:
-                if key_type == pygame.KEYDOWN:
-                    del self._keydown_funcs[func]
-                elif key_type == pygame.KEYUP:
-                    del self._keyup_funcs[func]    
-
-        self._del_funcs[pygame.KEYDOWN].clear()   
-        self._del_funcs[pygame.KEYUP].clear()
+        self._connections: dict[tuple[int, callable], tuple[typing.Union[int, None], ...]] = {}
+        self._sequence: int = 0
+
+        self.buffer_frames: int = 6
+
+        self._actions: dict[str, int] = {}
+        self._bindings: dict[tuple[int, int], list[int]] = {}
+        self._sources: dict[int, set[tuple[int, int]]] = {}
+
+        self._held: int = 0
+        self._pressed: int = 0
+        self._released: int = 0
+
+        self._buffered: dict[int, int] = {}
+        self._frame: int = 0
+        self._consumed: bool = True
+
+        self.recorder: typing.Union[InputRecorder, None] = None
+
+    @staticmethod
+    def _accepts_event(func: callable, arg_count: int) -> bool:
+        try:
+            parameters: list[inspect.Parameter] = list(inspect.signature(func).parameters.values())
+        except (TypeError, ValueError):
+            return True
+
+        if any(parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in parameters):
+            return True
+
+        positional: int = sum(1 for parameter in parameters if parameter.kind in (
+            inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ))
+
+        return positional > arg_count
+
+    def _dispatch(self, event: pygame.Event) -> None:
+        buckets: dict[typing.Union[int, None], dict[callable, FuncInfo]] = self._handlers[event.type]
+        if not buckets:
+            return
+
+        attribute: typing.Union[str, None] = self._EVENT_KEYS[event.type]
+
+        matched: typing.Union[dict[callable, FuncInfo], None] = buckets.get(getattr(event, attribute)) if attribute else None
+        wildcard: typing.Union[dict[callable, FuncInfo], None] = buckets.get(self.WILDCARD)
+
+        if matched and wildcard:
+            handlers: list[tuple[callable, FuncInfo]] = sorted((*matched.items(), *wildcard.items()), key=lambda item: item[1][0])
+        elif matched:
+            handlers: list[tuple[callable, FuncInfo]] = list(matched.items())
+        elif wildcard:
+            handlers: list[tuple[callable, FuncInfo]] = list(wildcard.items())
+        else:
+            return
+
+        for func, (_, args, accepts_event) in handlers:
+            if accepts_event:
+                func(*args, event)
+            else:
+                func(*args)
+
+    def _map_action(self, event: pygame.Event) -> None:
+        key_type: int = self._ACTION_EVENTS[event.type]
+        source: tuple[int, int] = (key_type, event.key if key_type == pygame.KEYDOWN else event.button)
+
+        bits: typing.Union[list[int], None] = self._bindings.get(source)
+        if not bits:
+            return
+
+        for bit in bits:
+            sources: set[tuple[int, int]] = self._sources.setdefault(bit, set())
+
+            if event.type == key_type:
+                if not sources:
+                    self._held |= 1 << bit
+                    self._pressed |= 1 << bit
+
+                sources.add(source)
+
+            elif source in sources:
+                sources.remove(source)
+
+                if not sources:
+                    self._held &= ~(1 << bit)
+                    self._released |= 1 << bit
+
+    def _buffer_actions(self, pressed: int) -> None:
+        self._frame += 1
+
+        while pressed:
+            low: int = pressed & -pressed
+            self._buffered[low.bit_length() - 1] = self._frame
+            pressed ^= low
+
+    def _clear_edges(self) -> int:
+        if self._consumed:
+            self._pressed = 0
+            self._released = 0
+            self._consumed = False
+
+        return self._pressed
+
+    def _apply_frame(self, held: int, pressed: int, released: typing.Optional[int] = None,
+                     keys: typing.Optional[typing.Sequence[int]] = None) -> None:
+
+        carried: int = self._clear_edges()
+
+        self._released = self._released | self._held & ~held if released is None else released
+        self._held = held
+        self._pressed = pressed | carried
+
+        if keys is not None:
+            state: list[bool] = [False] * self._KEY_COUNT
+            for key in keys:
+                state[key] = True
+
+            self.pressed = pygame.key.ScancodeWrapper(state)
+
+        self._buffer_actions(pressed & ~carried)
+
+    def _end_frame(self, ticks: int, delta_time: float) -> None:
+        if self.recorder:
+            keys: list[int] = [key for key, down in enumerate(tuple.__iter__(self.pressed or ())) if down]
+            self.recorder.write(ticks, delta_time, self._held, self._pressed, self._released, keys)
+
+        if ticks:
+            self._consumed = True
 
     def _run(self, events: list[pygame.Event]) -> bool:
+        carried: int = self._clear_edges()
+
         for event in events:
             if event.type == pygame.QUIT:
                 return True
-            
-            if event.type == pygame.KEYDOWN:
-                self._iter_funcs(event, self._keydown_funcs)
 
-            if event.type == pygame.KEYUP:
-                self._iter_funcs(event, self._keyup_funcs)
+            if event.type in self._ACTION_EVENTS:
+                self._map_action(event)
+
+            if event.type in self._handlers:
+                self._dispatch(event)
 
+        self._buffer_actions(self._pressed & ~carried)
         self.pressed = pygame.key.get_pressed()
 
         return False
 
+    def bind(self, action: str, keys: typing.Union[int, typing.Sequence[int]],
+             key_type: typing.Optional[int] = pygame.KEYDOWN) -> None:
+
+        assert key_type in self._ACTION_EVENTS.values()
+
+        if action not in self._actions:
+            if self.recorder:
+                raise RuntimeError(f'[Input] bind Failed: cannot add action {action} while recording')
+
+            self._actions[action] = len(self._actions)
+
+        bit: int = self._actions[action]
+
+        for key in ((keys,) if isinstance(keys, int) else keys):
+            bits: list[int] = self._bindings.setdefault((key_type, key), [])
+            if bit not in bits:
+                bits.append(bit)
+
+    def unbind(self, action: str) -> None:
+        bit: int = self._actions[action]
+
+        for source in list(self._bindings):
+            bits: list[int] = self._bindings[source]
+            if bit in bits:
+                bits.remove(bit)
+
+            if not bits:
+                del self._bindings[source]
+
+        self._sources.pop(bit, None)
+        self._held &= ~(1 << bit)
+
+    def is_held(self, action: str) -> bool:
+        return bool(self._held >> self._actions[action] & 1)
+
+    def is_pressed(self, action: str) -> bool:
+        return bool(self._pressed >> self._actions[action] & 1)
+
+    def is_released(self, action: str) -> bool:
+        return bool(self._released >> self._actions[action] & 1)
+
+    def consume(self, action: str) -> bool:
+        bit: int = self._actions[action]
+
+        frame: typing.Union[int, None] = self._buffered.pop(bit, None)
+        return frame is not None and self._frame - frame <= self.buffer_frames
+
+    def reset(self) -> None:
+        self._sources.clear()
+        self._buffered.clear()
+
+        self._held = 0
+        self._pressed = 0
+        self._released = 0
+        self._consumed = True
+
+    def get_actions(self) -> tuple[str]:
+        return tuple(self._actions)
+
+    def record(self, path: str) -> None:
+        if self.recorder:
+            self.stop_recording()
+
+        self.recorder = InputRecorder(path, self.get_actions())
+
+    def stop_recording(self) -> int:
+        if not self.recorder:
+            return 0
+
+        frames: int = self.recorder.frames
+
+        self.recorder.close()
+        self.recorder = None
+
+        return frames
+
     def connect(self, keys: typing.Union[None, int, typing.Sequence[int]],
                 key_type: int, func: callable, *args: typing.Sequence[any]) -> None:
-    
-        assert key_type == pygame.KEYDOWN or key_type == pygame.KEYUP
 
-        if key_type == pygame.KEYDOWN:
-            self._keydown_funcs[func] = (args, keys)
-        elif key_type == pygame.KEYUP:
-            self._keyup_funcs[func] = (args, keys)
+        assert key_type in self._handlers
+
+        if (key_type, func) in self._connections:
+            self.disconnect(func, key_type)
+
+        if keys is None or isinstance(keys, int):
+            keys = (keys,)
+        else:
+            keys = tuple(dict.fromkeys(keys))
+
+        info: FuncInfo = (self._sequence, args, self._accepts_event(func, len(args)))
+        self._sequence += 1
+
+        for key in keys:
+            self._handlers[key_type].setdefault(key, {})[func] = info
+
+        self._connections[(key_type, func)] = tuple(keys)
 
     def disconnect(self, func: callable, key_type: int) -> None:
-        assert key_type == pygame.KEYDOWN or key_type == pygame.KEYUP
-      
-        if key_type == pygame.KEYDOWN:
-            if not self._itering:
-                del self._keydown_funcs[func]
-            else:
-                self._del_funcs[pygame.KEYDOWN].append(func)
+        assert key_type in self._handlers
 
-        elif key_type == pygame.KEYUP:
-            if not self._itering:
-                del self._keyup_funcs[func]
-            else:
-                self._del_funcs[pygame.KEYUP].append(func)
+        for key in self._connections.pop((key_type, func)):
+            bucket: dict[callable, FuncInfo] = self._handlers[key_type][key]
+            del bucket[func]
+
+            if not bucket:
+                del self._handlers[key_type][key]
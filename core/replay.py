@@ -0,0 +1,104 @@
+import typing
+import struct
+
+LOG_MAGIC: typing.Final[bytes] = b'PGEI'
+LOG_VERSION: typing.Final[int] = 2
+
+_HEADER: typing.Final[struct.Struct] = struct.Struct('<4sBHI')
+_FRAME: typing.Final[struct.Struct] = struct.Struct('<HdH')
+
+ActionFrame = typing.NewType('ActionFrame', tuple[int, float, int, int, int, tuple[int]])
+
+def _get_mask_size(action_count: int) -> int:
+    return max(1, (action_count + 7) // 8)
+
+class InputRecorder:
+    def __init__(self, path: str, actions: typing.Sequence[str]):
+        self.actions: tuple[str] = tuple(actions)
+        self.frames: int = 0
+
+        self._mask_size: int = _get_mask_size(len(self.actions))
+        self._file: typing.BinaryIO = open(path, 'wb')
+
+        names: bytes = '\n'.join(self.actions).encode()
+        self._file.write(_HEADER.pack(LOG_MAGIC, LOG_VERSION, len(self.actions), len(names)))
+        self._file.write(names)
+
+    def write(self, ticks: int, delta_time: float, held: int, pressed: int, released: int,
+              keys: typing.Sequence[int]) -> None:
+
+        self._file.write(_FRAME.pack(ticks, delta_time, len(keys)))
+        self._file.write(held.to_bytes(self._mask_size, 'little'))
+        self._file.write(pressed.to_bytes(self._mask_size, 'little'))
+        self._file.write(released.to_bytes(self._mask_size, 'little'))
+        self._file.write(struct.pack(f'<{len(keys)}H', *keys))
+        self.frames += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+class InputLog:
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            data: bytes = f.read()
+
+        magic, version, action_count, names_size = _HEADER.unpack_from(data)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError(f'[InputLog] __init__ Failed: {path} is not a version {LOG_VERSION} input log')
+
+        offset: int = _HEADER.size
+        names: str = data[offset:offset + names_size].decode()
+
+        self.actions: tuple[str] = tuple(names.split('\n')) if action_count else ()
+
+        self._mask_size: int = _get_mask_size(action_count)
+        self._data: memoryview = memoryview(data)[offset + names_size:]
+
+        self._offsets: list[int] = []
+
+        offset = 0
+        while offset + _FRAME.size <= len(self._data):
+            self._offsets.append(offset)
+            offset += _FRAME.size + self._mask_size * 3 + _FRAME.unpack_from(self._data, offset)[2] * 2
+
+        if offset > len(self._data):
+            self._offsets.pop()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> typing.Iterator[ActionFrame]:
+        size: int = self._mask_size
+        data: memoryview = self._data
+
+        for offset in self._offsets:
+            ticks, delta_time, key_count = _FRAME.unpack_from(data, offset)
+            offset += _FRAME.size
+
+            masks: list[int] = [
+                int.from_bytes(data[offset + size * i:offset + size * (i + 1)], 'little') for i in range(3)
+            ]
+            offset += size * 3
+
+            yield ticks, delta_time, *masks, struct.unpack_from(f'<{key_count}H', data, offset)
+
+    def remap(self, actions: typing.Sequence[str]) -> typing.Iterator[ActionFrame]:
+        missing: list[str] = [action for action in self.actions if action not in actions]
+        if missing:
+            raise ValueError(f'[InputLog] remap Failed: actions {missing} are not bound')
+
+        bits: list[int] = [list(actions).index(action) for action in self.actions]
+        if bits == list(range(len(bits))):
+            yield from self
+            return
+
+        def remap_mask(mask: int) -> int:
+            result: int = 0
+            for i, bit in enumerate(bits):
+                if mask >> i & 1:
+                    result |= 1 << bit
+
+            return result
+
+        for ticks, delta_time, held, pressed, released, keys in self:
+            yield ticks, delta_time, remap_mask(held), remap_mask(pressed), remap_mask(released), keys
@@ -1,6 +1,157 @@
 from pge.types import Singleton
 
+import collections
+import pygame
+import typing
+
 @Singleton
 class Sound:
+    MEMORY_BUDGET: typing.Final[int] = 64 * 1024 * 1024
+    CHANNELS: typing.Final[int] = 16
+
     def __init__(self):
-        ...
+        self._samples: collections.OrderedDict[str, pygame.mixer.Sound] = collections.OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._size: int = 0
+
+        self._channels: list[pygame.mixer.Channel] = []
+        self._priorities: list[int] = []
+        self._started: list[int] = []
+        self._sequence: int = 0
+
+        self._played: dict[str, int] = {}
+
+        self.budget: int = self.MEMORY_BUDGET
+        self.channel_count: int = self.CHANNELS
+        self.rate_limit: int = 1
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stolen: int = 0
+        self.limited: int = 0
+
+    @staticmethod
+    def _get_size(sound: pygame.mixer.Sound, mixer: tuple[int, int, int]) -> int:
+        frequency, size, channels = mixer
+        return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+    def _evict(self) -> None:
+        while self._size > self.budget and len(self._samples) > 1:
+            path, _ = self._samples.popitem(last=False)
+            self._size -= self._sizes.pop(path)
+
+    def _get_channels(self) -> list[pygame.mixer.Channel]:
+        if len(self._channels) != self.channel_count:
+            pygame.mixer.set_num_channels(self.channel_count)
+
+            self._channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+            self._priorities = [0] * self.channel_count
+            self._started = [0] * self.channel_count
+
+        return self._channels
+
+    def _get_channel(self, priority: int) -> typing.Union[int, None]:
+        channels: list[pygame.mixer.Channel] = self._get_channels()
+
+        for i, channel in enumerate(channels):
+            if not channel.get_busy():
+                return i
+
+        index: int = min(range(len(channels)), key=lambda i: (self._priorities[i], self._started[i]))
+        if self._priorities[index] > priority:
+            return None
+
+        channels[index].stop()
+        self.stolen += 1
+
+        return index
+
+    def _run(self) -> None:
+        self._played.clear()
+
+    def load(self, path: str) -> pygame.mixer.Sound:
+        if path in self._samples:
+            self.hits += 1
+            self._samples.move_to_end(path)
+            return self._samples[path]
+
+        self.misses += 1
+
+        mixer: typing.Union[tuple[int, int, int], None] = pygame.mixer.get_init()
+        if mixer is None:
+            raise RuntimeError(f'[Sound] load Failed: mixer is not initialised, cannot load {path}')
+
+        sound: pygame.mixer.Sound = pygame.mixer.Sound(path)
+
+        self._samples[path] = sound
+        self._sizes[path] = self._get_size(sound, mixer)
+        self._size += self._sizes[path]
+        self._evict()
+
+        return sound
+
+    def preload(self, paths: typing.Sequence[str]) -> None:
+        for path in paths:
+            self.load(path)
+
+    def play(self, path: str, priority: typing.Optional[int] = 0, volume: typing.Optional[float] = 1.0,
+             loops: typing.Optional[int] = 0, fade_ms: typing.Optional[int] = 0) -> typing.Union[pygame.mixer.Channel, None]:
+
+        count: int = self._played.get(path, 0)
+        if count >= self.rate_limit:
+            self.limited += 1
+            return None
+
+        sound: pygame.mixer.Sound = self.load(path)
+
+        index: typing.Union[int, None] = self._get_channel(priority)
+        if index is None:
+            return None
+
+        self._played[path] = count + 1
+
+        channel: pygame.mixer.Channel = self._channels[index]
+        channel.set_volume(volume)
+        channel.play(sound, loops, fade_ms=fade_ms)
+
+        self._priorities[index] = priority
+        self._started[index] = self._sequence
+        self._sequence += 1
+
+        return channel
+
+    def stop(self, path: typing.Optional[str] = None) -> None:
+        if path is None:
+            pygame.mixer.stop()
+            return
+
+        sound: typing.Union[pygame.mixer.Sound, None] = self._samples.get(path)
+        if sound:
+            sound.stop()
+
+    def play_music(self, path: str, loops: typing.Optional[int] = -1, volume: typing.Optional[float] = 1.0,
+                   fade_ms: typing.Optional[int] = 0) -> None:
+
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops, fade_ms=fade_ms)
+
+    def queue_music(self, path: str, loops: typing.Optional[int] = 0) -> None:
+        pygame.mixer.music.queue(path, loops=loops)
+
+    def stop_music(self, fade_ms: typing.Optional[int] = 0) -> None:
+        if fade_ms:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def pause_music(self) -> None:
+        pygame.mixer.music.pause()
+
+    def resume_music(self) -> None:
+        pygame.mixer.music.unpause()
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._sizes.clear()
+        self._size = 0
@@ -1,9 +1,19 @@
-from pge.utils import scale
+from pge.utils import get_mask, TransformCache
+
+from pge.core import Assets
 
 import pygame
 import typing
+import weakref
+
+SourceKey = typing.NewType('SourceKey', typing.Union[pygame.Surface, tuple[str, float]])
 
 class Sprite(pygame.sprite.Sprite):
+    cache_stats: typing.ClassVar[dict[str, int]] = {
+        'mask_hits': 0,
+        'mask_misses': 0
+    }
+
     def __init__(self, image: typing.Union[pygame.Surface, str], layer: typing.Optional[int] = 0, 
                  position: typing.Optional[pygame.Vector2] = pygame.Vector2(0, 0),
                  image_scale: typing.Optional[float] = 1):
@@ -11,33 +21,96 @@ def __init__(self, image: typing.Union[pygame.Surface, str], layer: typing.Optio
         pygame.sprite.Sprite.__init__(self)
         self.sprite_id: str = self.__class__.__name__
 
-        if isinstance(image, pygame.Surface):
-            self.image = image
-        else:
-            self.image: pygame.Surface = pygame.image.load(image)
-            self.image = scale(self.image, image_scale)
+        self._sprite_lists: weakref.WeakValueDictionary[int, list] = weakref.WeakValueDictionary()
+        self._source: typing.Union[SourceKey, None] = None
+
+        self.original_rect: typing.Union[pygame.FRect, None] = None
+        self.rect: typing.Union[pygame.FRect, None] = None
+
+        Sprite.reset(self, image, layer, position, image_scale)
 
-        self.image.set_colorkey((0, 0, 0))
+    def reset(self, image: typing.Union[pygame.Surface, str], layer: typing.Optional[int] = 0,
+              position: typing.Optional[pygame.Vector2] = pygame.Vector2(0, 0),
+              image_scale: typing.Optional[float] = 1) -> None:
 
-        self.original_image: typing.Final[pygame.Surface] = self.image.copy()
+        key: SourceKey = image if isinstance(image, pygame.Surface) else (image, image_scale)
+
+        # original_image and image may be shared with other sprites and caches; copy before drawing onto them
+        if key != self._source:
+            if isinstance(image, pygame.Surface):
+                source: pygame.Surface = image
+                source.set_colorkey((0, 0, 0))
+            else:
+                source: pygame.Surface = Assets().load(image, image_scale)
+
+            self._source = key
+            self.original_image: pygame.Surface = source
+
+        self.image = self.original_image
 
         self.layer: int = layer
+        self.tint: tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
+
+        if self.original_rect is None:
+            self.original_rect = self.original_image.get_frect(topleft=position)
+            self.rect = self.original_rect.copy()
+        else:
+            self.original_rect.update(position, self.original_image.get_size())
+            self.rect.update(self.original_rect)
+
+    @property
+    def layer(self) -> int:
+        return self._layer
 
-        self.rect: pygame.FRect = self.image.get_frect(topleft=position)
-        self.original_rect: typing.Final[pygame.FRect] = self.image.get_frect(topleft=position)
+    @layer.setter
+    def layer(self, value: int) -> None:
+        sprite_lists: list[list] = [sprite_list for sprite_list in list(self._sprite_lists.values()) if sprite_list._detach_sprite(self)]
+        self._layer = value
+
+        for sprite_list in sprite_lists:
+            sprite_list._attach_sprite(self)
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self._image
+
+    @image.setter
+    def image(self, value: pygame.Surface) -> None:
+        self._image = value
+        self._mask = None
 
     @property
     def mask(self) -> pygame.Mask:
-        return pygame.mask.from_surface(self.image)
-    
+        if self._mask is None:
+            Sprite.cache_stats['mask_misses'] += 1
+            self._mask = get_mask(self._image)
+        else:
+            Sprite.cache_stats['mask_hits'] += 1
+
+        return self._mask
+
     @property
     def position(self) -> pygame.Vector2:
-        return self.get_position()
+        return pygame.Vector2(self.rect.x, self.rect.y)
 
     @property
     def dimensions(self) -> pygame.Vector2:
-        return pygame.Vector2(self.rect.size)
+        return pygame.Vector2(self.rect.w, self.rect.h)
     
+    def transform(self, angle: typing.Optional[float] = 0.0, scale: typing.Optional[float] = 1.0,
+                  flip: typing.Optional[tuple[bool, bool]] = (False, False)) -> pygame.Surface:
+
+        image: pygame.Surface = TransformCache().get(self.original_image, angle, scale, flip)
+
+        if image is not self._image:
+            center: tuple[float, float] = self.rect.center
+
+            self.image = image
+            self.rect.size = image.get_size()
+            self.rect.center = center
+
+        return image
+
     def get_position(self, point: str = 'topleft') -> pygame.Vector2:
         return pygame.Vector2(getattr(self.rect, point))
 
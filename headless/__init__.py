@@ -0,0 +1 @@
+from pge.headless.runner import World, HeadlessRunner
@@ -0,0 +1,142 @@
+from pge.core import Input
+from pge.core.replay import InputLog
+from pge.containers import SpriteList
+
+import concurrent.futures
+import random
+import pygame
+import typing
+import time
+import os
+
+WorldSpec = typing.NewType('WorldSpec', tuple[int, any])
+WorldResult = typing.NewType('WorldResult', dict[str, any])
+
+class World:
+    def __init__(self, seed: int, state: any, frame_rate: typing.Optional[int] = 60,
+                 delta_time: typing.Optional[float] = 1.0):
+
+        self.seed: int = seed
+        self.state: any = state
+
+        self.random: random.Random = random.Random(seed)
+        random.seed(seed)
+
+        self.frame_rate: int = frame_rate
+        self.delta_time: float = delta_time
+
+        self.frame: int = 0
+        self.frame_count: float = 0
+
+        self.inputs: Input = Input()
+        self.inputs.reset()
+        self.sprites: SpriteList = SpriteList()
+
+        self.done: bool = False
+        self.result: any = None
+
+    def stop(self, result: typing.Optional[any] = None) -> None:
+        self.done = True
+        self.result = result
+
+    def step(self, update: typing.Union[typing.Callable, None], held: typing.Optional[int] = 0,
+             pressed: typing.Optional[int] = 0, released: typing.Optional[int] = None,
+             keys: typing.Optional[typing.Sequence[int]] = None, ticks: typing.Optional[int] = 1) -> None:
+
+        self.inputs._apply_frame(held, pressed, released, keys)
+
+        for _ in range(ticks):
+            self.frame += 1
+            self.frame_count += 1 * self.delta_time
+
+            if update:
+                update(self)
+
+            self.sprites.update_all()
+
+            if self.done:
+                break
+
+        self.inputs._end_frame(ticks, self.delta_time)
+
+class HeadlessRunner:
+    def __init__(self, update: typing.Callable, frames: int, setup: typing.Optional[typing.Callable] = None,
+                 result: typing.Optional[typing.Callable] = None, workers: typing.Optional[int] = None,
+                 frame_rate: typing.Optional[int] = 60, delta_time: typing.Optional[float] = 1.0):
+
+        self.update: typing.Callable = update
+        self.setup: typing.Union[typing.Callable, None] = setup
+        self.result: typing.Union[typing.Callable, None] = result
+
+        self.frames: int = frames
+        self.workers: int = os.cpu_count() if workers is None else workers
+
+        self.frame_rate: int = frame_rate
+        self.delta_time: float = delta_time
+
+    @staticmethod
+    def _init_display() -> None:
+        if pygame.display.get_surface() is not None:
+            return
+
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    @staticmethod
+    def _init_worker() -> None:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+        HeadlessRunner._init_display()
+
+    def _get_specs(self, worlds: typing.Union[int, typing.Sequence[any]],
+                   seeds: typing.Union[typing.Sequence[int], None]) -> list[WorldSpec]:
+
+        states: list[any] = [None] * worlds if isinstance(worlds, int) else list(worlds)
+        seeds = list(seeds) if seeds is not None else list(range(len(states)))
+
+        if len(seeds) != len(states):
+            raise ValueError(f'[HeadlessRunner] run Failed: {len(seeds)} seeds for {len(states)} worlds')
+
+        return list(zip(seeds, states))
+
+    def _run_world(self, spec: WorldSpec, replay: typing.Union[str, None] = None) -> WorldResult:
+        seed, state = spec
+        start: float = time.perf_counter()
+
+        world: World = World(seed, state, self.frame_rate, self.delta_time)
+        if self.setup:
+            self.setup(world)
+
+        if replay:
+            log: InputLog = InputLog(replay)
+            for ticks, delta_time, held, pressed, released, keys in log.remap(world.inputs.get_actions()):
+                if world.done or world.frame >= self.frames:
+                    break
+
+                world.delta_time = delta_time
+                world.step(self.update, held, pressed, released, keys, min(ticks, self.frames - world.frame))
+
+        while not world.done and world.frame < self.frames:
+            world.step(self.update)
+
+        return {
+            'seed': seed,
+            'frames': world.frame,
+            'elapsed': time.perf_counter() - start,
+            'result': self.result(world) if self.result else (world.result if world.done else world.state)
+        }
+
+    def run(self, worlds: typing.Union[int, typing.Sequence[any]], seeds: typing.Optional[typing.Sequence[int]] = None,
+            replays: typing.Optional[typing.Sequence[typing.Union[str, None]]] = None) -> list[WorldResult]:
+
+        specs: list[WorldSpec] = self._get_specs(worlds, seeds)
+        replays = list(replays) if replays is not None else [None] * len(specs)
+
+        if not self.workers:
+            self._init_display()
+            return [self._run_world(spec, replay) for spec, replay in zip(specs, replays)]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers, initializer=self._init_worker) as executor:
+            chunksize: int = max(1, len(specs) // (self.workers * 4))
+            return list(executor.map(self._run_world, specs, replays, chunksize=chunksize))
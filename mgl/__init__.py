@@ -1,2 +1,6 @@
 from pge.mgl.object import MGLObject
+from pge.mgl.batch import MGLBatch
+from pge.mgl.particles import MGLParticles
+from pge.mgl.graph import MGLGraph
+from pge.mgl.capture import MGLCapture
 from pge.mgl.renderer import MGLRenderer
@@ -0,0 +1,235 @@
+import typing
+import pygame
+import moderngl
+import operator
+import array
+
+UVRect = typing.NewType('UVRect', tuple[float, float, float, float])
+
+class MGLBatch:
+    INSTANCE_FORMAT: typing.Final[str] = '2f 2f 4f 1f 4f /i'
+    INSTANCE_ATTRIBUTES: typing.Final[tuple[str]] = ('position', 'size', 'uv_rect', 'layer', 'tint')
+    INSTANCE_FLOATS: typing.Final[int] = 13
+
+    def __init__(self, context: moderngl.Context, program: moderngl.Program, texture: moderngl.Texture,
+                 location: int, framebuffer: typing.Union[moderngl.Framebuffer, None],
+                 capacity: typing.Optional[int] = 1024):
+
+        self.context: moderngl.Context = context
+        self.program: moderngl.Program = program
+
+        self.texture: moderngl.Texture = texture
+        self.location: int = location
+
+        self.framebuffer: moderngl.Framebuffer = framebuffer
+
+        self.shaders: tuple[str, str] = ('batch', 'batch')
+
+        self.inputs: tuple[str] = ()
+        self.output: typing.Union[str, None] = None
+        self.keep: bool = False
+
+        self.quad: moderngl.Buffer = context.buffer(data=array.array('f', [
+            0.0, 0.0,
+            1.0, 0.0,
+            0.0, 1.0,
+            1.0, 1.0
+        ]))
+
+        self.capacity: int = capacity
+        self.instances: moderngl.Buffer = context.buffer(reserve=capacity * self.INSTANCE_FLOATS * 4, dynamic=True)
+        self.array: moderngl.VertexArray = self._create_array()
+
+        self.data: array.array = array.array('f')
+        self.count: int = 0
+
+        self.camera: tuple[float, float] = (0.0, 0.0)
+        self.viewport: tuple[float, float] = (0.0, 0.0)
+        self.zoom: float = 1.0
+
+        self.background: typing.Union[tuple[float, float, float, float], None] = (0.0, 0.0, 0.0, 0.0)
+        self.repacks: int = 0
+
+        self._uvs: dict[pygame.Surface, UVRect] = {}
+        self._shelf: list[int] = [0, 0, 0]
+
+        self._images: list[pygame.Surface] = []
+        self._generation: int = 0
+
+    def _create_array(self) -> moderngl.VertexArray:
+        return self.context.vertex_array(
+            self.program,
+            [
+                (self.quad, '2f', 'vert'),
+                (self.instances, self.INSTANCE_FORMAT, *self.INSTANCE_ATTRIBUTES)
+            ]
+        )
+
+    def set_program(self, program: moderngl.Program) -> None:
+        self.array.release()
+
+        self.program = program
+        self.array = self._create_array()
+
+    def _place(self, image: pygame.Surface) -> typing.Union[UVRect, None]:
+        width, height = image.get_size()
+        atlas_width, atlas_height = self.texture.size
+
+        x, y, shelf_height = self._shelf
+        if x + width > atlas_width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+
+        if width > atlas_width or y + height > atlas_height:
+            return None
+
+        self.texture.write(pygame.image.tobytes(image.convert_alpha(), 'RGBA'), viewport=(x, y, width, height))
+        self._shelf = [x + width, y, max(shelf_height, height)]
+
+        self._uvs[image] = (x / atlas_width, y / atlas_height, width / atlas_width, height / atlas_height)
+        return self._uvs[image]
+
+    def _repack(self) -> None:
+        self._uvs.clear()
+        self._shelf = [0, 0, 0]
+
+        self._generation += 1
+        self.repacks += 1
+
+        for image in dict.fromkeys(self._images):
+            if self._place(image) is None:
+                raise ValueError(f'[MGLBatch] add_image Failed: {len(self._images)} images drawn this frame do not fit in atlas')
+
+    def _patch_uvs(self) -> None:
+        uvs: dict[pygame.Surface, UVRect] = self._uvs
+        data: array.array = self.data
+
+        for index, image in enumerate(self._images):
+            offset: int = index * self.INSTANCE_FLOATS + 4
+            data[offset:offset + 4] = array.array('f', uvs[image])
+
+    def _sort_layers(self) -> None:
+        floats: int = self.INSTANCE_FLOATS
+        layers: array.array = self.data[8::floats]
+
+        if all(map(operator.le, layers, layers[1:])):
+            return
+
+        data: array.array = self.data
+        self.data = array.array('f')
+
+        for index in sorted(range(self.count), key=layers.__getitem__):
+            self.data.extend(data[index * floats:(index + 1) * floats])
+
+    def add_image(self, image: pygame.Surface) -> UVRect:
+        if image in self._uvs:
+            return self._uvs[image]
+
+        uv: typing.Union[UVRect, None] = self._place(image)
+        if uv is None:
+            self._repack()
+            uv = self._uvs.get(image) or self._place(image)
+
+        if uv is None:
+            width, height = image.get_size()
+            raise ValueError(f'[MGLBatch] add_image Failed: {width}x{height} image does not fit in atlas')
+
+        return uv
+
+    def draw(self, image: pygame.Surface, position: tuple[float, float],
+             size: typing.Optional[tuple[float, float]] = None, layer: typing.Optional[int] = 0,
+             tint: typing.Optional[tuple[float, float, float, float]] = (1.0, 1.0, 1.0, 1.0)) -> None:
+
+        if not size:
+            size = image.get_size()
+
+        generation: int = self._generation
+        self._images.append(image)
+
+        self.data.extend((position[0], position[1], size[0], size[1], *self.add_image(image), layer, *tint))
+        self.count += 1
+
+        if self._generation != generation:
+            self._patch_uvs()
+
+    def draw_sprites(self, sprites: typing.Iterable[any]) -> None:
+        generation: int = self._generation
+
+        uvs: dict[pygame.Surface, UVRect] = self._uvs
+        add_image: typing.Callable = self.add_image
+
+        images: list[pygame.Surface] = self._images
+        append_image: typing.Callable = images.append
+
+        values: list[float] = []
+        extend: typing.Callable = values.extend
+
+        count: int = 0
+        for sprite in sprites:
+            image: pygame.Surface = sprite.image
+            append_image(image)
+
+            uv: UVRect = uvs.get(image) or add_image(image)
+
+            extend(sprite.rect)
+            extend(uv)
+            values.append(sprite.layer)
+            extend(sprite.tint)
+
+            count += 1
+
+        self.data.extend(values)
+        self.count += count
+
+        if self._generation != generation:
+            self._patch_uvs()
+
+    def set_camera(self, camera: any) -> None:
+        self.camera = tuple(camera.position)
+        self.viewport = camera.viewport.topleft
+        self.zoom = camera.zoom
+
+    def clear(self) -> None:
+        self.data = array.array('f')
+        self.count = 0
+
+        self._images = []
+
+        self.camera = (0.0, 0.0)
+        self.viewport = (0.0, 0.0)
+        self.zoom = 1.0
+
+    def render(self, screen) -> None:
+        if self.framebuffer and self.background:
+            self.framebuffer.clear(*self.background)
+
+        if not self.count:
+            return
+
+        self._sort_layers()
+
+        if self.count > self.capacity:
+            while self.capacity < self.count:
+                self.capacity *= 2
+
+            self.instances.orphan(self.capacity * self.INSTANCE_FLOATS * 4)
+
+        self.instances.write(self.data)
+
+        if self.framebuffer:
+            self.framebuffer.use()
+        else:
+            screen.use()
+
+        self.program['screen'] = screen.size if not self.framebuffer else self.framebuffer.size
+        self.program['atlas'] = self.location
+
+        self.program['camera'] = self.camera
+        self.program['viewport'] = self.viewport
+        self.program['zoom'] = self.zoom
+        self.texture.use(self.location)
+
+        self.context.enable(moderngl.BLEND)
+        self.array.render(moderngl.TRIANGLE_STRIP, instances=self.count)
+        self.context.disable(moderngl.BLEND)
+
+        self.clear()
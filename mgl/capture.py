@@ -0,0 +1,111 @@
+import threading
+import moderngl
+import pygame
+import typing
+import queue
+import os
+
+CaptureFrame = typing.NewType('CaptureFrame', tuple[int, bytes])
+
+class MGLCapture:
+    FORMATS: typing.Final[tuple[str]] = ('png', 'raw')
+
+    QUEUE_SIZE: typing.Final[int] = 8
+
+    def __init__(self, context: moderngl.Context, dimensions: tuple[int, int], path: str,
+                 format: typing.Optional[str] = 'png', ring: typing.Optional[int] = 3,
+                 every: typing.Optional[int] = 1, block: typing.Optional[bool] = True):
+
+        if format not in self.FORMATS:
+            raise ValueError(f'[MGLCapture] __init__ Failed: unknown format {format}, expected one of {self.FORMATS}')
+
+        self.context: moderngl.Context = context
+        self.dimensions: tuple[int, int] = dimensions
+
+        self.path: str = path
+        self.format: str = format
+        self.every: int = every
+        self.block: bool = block
+
+        self.frames: int = 0
+        self.written: int = 0
+        self.dropped: int = 0
+
+        self._pbos: list[moderngl.Buffer] = [context.buffer(reserve=dimensions[0] * dimensions[1] * 4) for _ in range(ring)]
+        self._pending: list[typing.Union[int, None]] = [None] * ring
+        self._index: int = 0
+        self._tick: int = 0
+
+        self._queue: queue.Queue[typing.Union[CaptureFrame, None]] = queue.Queue(self.QUEUE_SIZE)
+        self._file: typing.Union[typing.BinaryIO, None] = None
+
+        if format == 'png':
+            os.makedirs(path, exist_ok=True)
+        else:
+            self._file = open(path, 'wb')
+
+        self._thread: threading.Thread = threading.Thread(target=self._encode, name='pge-capture', daemon=True)
+        self._thread.start()
+
+    def _encode(self) -> None:
+        while True:
+            frame: typing.Union[CaptureFrame, None] = self._queue.get()
+            if frame is None:
+                break
+
+            number, data = frame
+            image: pygame.Surface = pygame.image.frombytes(data, self.dimensions, 'RGBA', True)
+
+            if self._file:
+                self._file.write(pygame.image.tobytes(image, 'RGBA'))
+            else:
+                pygame.image.save(image, os.path.join(self.path, f'frame_{number:06d}.png'))
+
+            self.written += 1
+
+    def _submit(self, number: int, data: bytes) -> None:
+        if self.block:
+            self._queue.put((number, data))
+            return
+
+        try:
+            self._queue.put_nowait((number, data))
+        except queue.Full:
+            self.dropped += 1
+
+    def _collect(self, index: int) -> None:
+        number: typing.Union[int, None] = self._pending[index]
+        if number is None:
+            return
+
+        self._submit(number, self._pbos[index].read())
+        self._pending[index] = None
+
+    def capture(self, framebuffer: moderngl.Framebuffer) -> None:
+        self._tick += 1
+        if (self._tick - 1) % self.every:
+            return
+
+        index: int = self._index
+        self._collect(index)
+
+        framebuffer.read_into(self._pbos[index], components=4, alignment=1)
+        self._pending[index] = self.frames
+
+        self.frames += 1
+        self._index = (index + 1) % len(self._pbos)
+
+    def close(self) -> int:
+        for i in range(len(self._pbos)):
+            self._collect((self._index + i) % len(self._pbos))
+
+        self._queue.put(None)
+        self._thread.join()
+
+        if self._file:
+            self._file.close()
+
+        for pbo in self._pbos:
+            pbo.release()
+
+        return self.written
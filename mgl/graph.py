@@ -0,0 +1,114 @@
+from pge.mgl import MGLObject
+
+import moderngl
+import typing
+
+TransientInfo = typing.NewType('TransientInfo', tuple[tuple[int, int], str])
+
+class MGLGraph:
+    def __init__(self, context: moderngl.Context):
+        self.context: moderngl.Context = context
+
+        self.order: list[tuple[str, MGLObject]] = []
+        self.assignments: dict[str, int] = {}
+
+        self._pool: list[tuple[moderngl.Texture, moderngl.Framebuffer, int, TransientInfo]] = []
+
+    def _get_live(self, objects: dict[str, MGLObject], producers: dict[str, list[str]],
+                  transients: dict[str, TransientInfo]) -> set[str]:
+
+        live: set[str] = set()
+        stack: list[str] = [name for name, obj in objects.items() if obj.output not in transients or obj.keep]
+
+        while stack:
+            name: str = stack.pop()
+            if name in live:
+                continue
+
+            live.add(name)
+            for texture in objects[name].inputs:
+                stack.extend(producers.get(texture, ()))
+
+        return live
+
+    def _sort(self, objects: dict[str, MGLObject], producers: dict[str, list[str]], live: set[str]) -> list[str]:
+        names: list[str] = [name for name in objects if name in live]
+        index: dict[str, int] = {name: i for i, name in enumerate(names)}
+
+        dependencies: dict[str, set[str]] = {
+            name: set(p for texture in objects[name].inputs for p in producers.get(texture, ()) if p in live and p != name)
+            for name in names
+        }
+
+        order: list[str] = []
+        remaining: set[str] = set(names)
+
+        while remaining:
+            ready: list[str] = [name for name in remaining if not (dependencies[name] & remaining)]
+            if not ready:
+                raise ValueError(f'[MGLGraph] compile Failed: cycle between {sorted(remaining)}')
+
+            name: str = min(ready, key=index.get)
+            order.append(name)
+            remaining.remove(name)
+
+        return order
+
+    def compile(self, objects: dict[str, MGLObject], transients: dict[str, TransientInfo],
+                allocate: typing.Callable[[TransientInfo], tuple[moderngl.Texture, moderngl.Framebuffer, int]]) -> None:
+
+        producers: dict[str, list[str]] = {}
+        for name, obj in objects.items():
+            if obj.output is not None:
+                producers.setdefault(obj.output, []).append(name)
+
+        live: set[str] = self._get_live(objects, producers, transients)
+        order: list[str] = self._sort(objects, producers, live)
+
+        last_use: dict[str, int] = {}
+        for i, name in enumerate(order):
+            for texture in objects[name].inputs:
+                if texture in transients:
+                    last_use[texture] = i
+
+        free: list[int] = list(range(len(self._pool)))
+        assignments: dict[str, int] = {}
+
+        for i, name in enumerate(order):
+            obj: MGLObject = objects[name]
+
+            if obj.output in transients and obj.output not in assignments:
+                info: TransientInfo = transients[obj.output]
+                slot: typing.Union[int, None] = next((s for s in free if self._pool[s][3] == info), None)
+
+                if slot is None:
+                    self._pool.append((*allocate(info), info))
+                    slot = len(self._pool) - 1
+                else:
+                    free.remove(slot)
+
+                assignments[obj.output] = slot
+
+            for texture in obj.inputs:
+                if texture in assignments and last_use.get(texture) == i and texture != obj.output:
+                    free.append(assignments[texture])
+
+            if obj.output in assignments and obj.output not in last_use:
+                free.append(assignments[obj.output])
+
+        for name in order:
+            obj: MGLObject = objects[name]
+
+            if obj.output in assignments:
+                obj.framebuffer = self._pool[assignments[obj.output]][1]
+
+            for texture in obj.inputs:
+                if texture in assignments:
+                    obj.uniform(texture, self._pool[assignments[texture]][2])
+
+        self.order = [(name, objects[name]) for name in order]
+        self.assignments = assignments
+
+    @property
+    def allocated(self) -> int:
+        return len(self._pool)
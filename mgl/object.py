@@ -1,19 +1,53 @@
 import typing
 import moderngl
 
-class MGLObject:       
+class MGLObject:
     def __init__(self, program: moderngl.Program, array: moderngl.VertexArray,
-                 framebuffer: typing.Union[moderngl.Framebuffer, None]):
+                 framebuffer: typing.Union[moderngl.Framebuffer, None],
+                 inputs: typing.Optional[typing.Sequence[str]] = (), output: typing.Optional[str] = None,
+                 keep: typing.Optional[bool] = False, buffer: typing.Optional[moderngl.Buffer] = None):
 
         self.program: moderngl.Program = program
         self.array: moderngl.VertexArray = array
+        self.buffer: typing.Union[moderngl.Buffer, None] = buffer
 
         self.framebuffer: moderngl.Framebuffer = framebuffer
-    
+
+        self.inputs: tuple[str] = tuple(inputs)
+        self.output: typing.Union[str, None] = output
+        self.keep: bool = keep
+
+        self.shaders: tuple[str, str] = ('default', 'default')
+        self.uniforms: dict[str, any] = {}
+
+    def _apply_uniforms(self) -> None:
+        program: moderngl.Program = self.program
+
+        for attribute, value in self.uniforms.items():
+            member: typing.Union[moderngl.Uniform, None] = program.get(attribute, None)
+            if member is not None:
+                member.value = value
+
+    def uniform(self, attribute: str, value: any) -> None:
+        self.uniforms[attribute] = value
+
+        member: typing.Union[moderngl.Uniform, None] = self.program.get(attribute, None)
+        if member is not None:
+            member.value = value
+
+    def set_program(self, program: moderngl.Program, array: moderngl.VertexArray) -> None:
+        self.array.release()
+
+        self.program = program
+        self.array = array
+
+        self._apply_uniforms()
+
     def render(self, screen) -> None:
         if self.framebuffer:
             self.framebuffer.use()
         else:
             screen.use()
-        
+
+        self._apply_uniforms()
         self.array.render(moderngl.TRIANGLE_STRIP)
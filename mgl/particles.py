@@ -0,0 +1,126 @@
+import typing
+import pygame
+import moderngl
+import weakref
+import array
+
+class MGLParticles:
+    INSTANCE_ATTRIBUTES: typing.Final[tuple[tuple[str, int, str], ...]] = (
+        ('x', 1, 'x'), ('y', 1, 'y'), ('vx', 1, 'vx'), ('vy', 1, 'vy'),
+        ('birth', 1, 'birth'), ('death', 1, 'death'), ('sizes', 1, 'size'), ('colors', 4, 'tint')
+    )
+
+    def __init__(self, context: moderngl.Context, program: moderngl.Program, location: int,
+                 framebuffer: typing.Union[moderngl.Framebuffer, None], capacity: typing.Optional[int] = 4096):
+
+        self.context: moderngl.Context = context
+        self.program: moderngl.Program = program
+        self.location: int = location
+
+        self.framebuffer: moderngl.Framebuffer = framebuffer
+
+        self.shaders: tuple[str, str] = ('particle', 'batch')
+
+        self.inputs: tuple[str] = ()
+        self.output: typing.Union[str, None] = None
+        self.keep: bool = False
+
+        self.quad: moderngl.Buffer = context.buffer(data=array.array('f', [
+            0.0, 0.0,
+            1.0, 0.0,
+            0.0, 1.0,
+            1.0, 1.0
+        ]))
+
+        self.capacity: int = capacity
+        self.instances: dict[str, moderngl.Buffer] = {}
+        self._create_buffers()
+
+        self.array: moderngl.VertexArray = self._create_array()
+
+        self.emitters: list[any] = []
+
+        self._textures: weakref.WeakKeyDictionary[pygame.Surface, moderngl.Texture] = weakref.WeakKeyDictionary()
+
+    def _create_buffers(self) -> None:
+        for attribute, components, _ in self.INSTANCE_ATTRIBUTES:
+            self.instances[attribute] = self.context.buffer(reserve=self.capacity * components * 4, dynamic=True)
+
+    def _create_array(self) -> moderngl.VertexArray:
+        return self.context.vertex_array(
+            self.program,
+            [
+                (self.quad, '2f', 'vert'),
+                *((self.instances[attribute], f'{components}f /i', name) for attribute, components, name in self.INSTANCE_ATTRIBUTES)
+            ]
+        )
+
+    def _get_texture(self, image: pygame.Surface) -> moderngl.Texture:
+        if image not in self._textures:
+            texture: moderngl.Texture = self.context.texture(image.get_size(), 4, pygame.image.tobytes(image.convert_alpha(), 'RGBA'))
+            texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+
+            self._textures[image] = texture
+            weakref.finalize(image, texture.release).atexit = False
+
+        return self._textures[image]
+
+    def set_program(self, program: moderngl.Program) -> None:
+        self.array.release()
+
+        self.program = program
+        self.array = self._create_array()
+
+    def draw(self, emitter: any) -> None:
+        self.emitters.append(emitter)
+
+    def clear(self) -> None:
+        self.emitters.clear()
+
+    def render(self, screen) -> None:
+        if not self.emitters:
+            return
+
+        capacity: int = max(emitter.count for emitter in self.emitters)
+        if capacity > self.capacity:
+            while self.capacity < capacity:
+                self.capacity *= 2
+
+            for instance in self.instances.values():
+                instance.release()
+
+            self._create_buffers()
+
+            self.array.release()
+            self.array = self._create_array()
+
+        if self.framebuffer:
+            self.framebuffer.use()
+        else:
+            screen.use()
+
+        self.program['screen'] = screen.size if not self.framebuffer else self.framebuffer.size
+        self.program['atlas'] = self.location
+
+        self.context.enable(moderngl.BLEND)
+
+        for emitter in self.emitters:
+            count: int = emitter.count
+            if not count:
+                continue
+
+            for attribute, components, _ in self.INSTANCE_ATTRIBUTES:
+                self.instances[attribute].write(memoryview(getattr(emitter, attribute))[:count * components])
+
+            self.program['time'] = emitter.time
+            self.program['gravity'] = emitter.gravity
+            self.program['drag'] = emitter.drag
+            self.program['layer'] = emitter.layer
+            self.program['fade'] = emitter.fade
+
+            self._get_texture(emitter.image).use(self.location)
+            self.array.render(moderngl.TRIANGLE_STRIP, instances=count)
+
+        self.context.disable(moderngl.BLEND)
+
+        self.clear()
@@ -1,11 +1,19 @@
 from pge.types import Singleton
+from pge.utils import Profiler
 
 from pge.mgl import MGLObject
+from pge.mgl import MGLBatch
+from pge.mgl import MGLParticles
+from pge.mgl import MGLGraph
+from pge.mgl import MGLCapture
 
 import moderngl
+import hashlib
 import pygame
+import warnings
 import typing
 import array
+import time
 import os
 
 @Singleton
@@ -37,24 +45,107 @@ def create(name: str, primary: typing.Optional[bool] = True,
             mgl.t_i += 1
 
         @staticmethod
-        def write(name: str, data: any) -> None:       
+        def mark_dirty(name: str, rect: typing.Optional[typing.Union[pygame.Rect, typing.Sequence[int]]] = None) -> None:
+            assert MGLRenderer.instanced
+            mgl: MGLRenderer = MGLRenderer()
+
+            rects: list[typing.Union[pygame.Rect, None]] = mgl.dirty.setdefault(name, [])
+            if None in rects:
+                return
+
+            if rect is None:
+                rects[:] = [None]
+                return
+
+            rects.append(pygame.Rect(rect))
+
+            if len(rects) > mgl.DIRTY_LIMIT:
+                rects[:] = [rects[0].unionall(rects[1:])]
+
+        @staticmethod
+        def blit(name: str, surface: pygame.Surface, source: pygame.Surface, dest: typing.Sequence[float],
+                 area: typing.Optional[pygame.Rect] = None, special_flags: typing.Optional[int] = 0) -> pygame.Rect:
+
+            assert MGLRenderer.instanced
+            mgl: MGLRenderer = MGLRenderer()
+
+            rect: pygame.Rect = surface.blit(source, dest, area, special_flags)
+            mgl.Texture.mark_dirty(name, rect)
+
+            return rect
+
+        @staticmethod
+        def write(name: str, data: any, rects: typing.Optional[typing.Sequence[pygame.Rect]] = None) -> None:
             assert MGLRenderer.instanced
 
             mgl: MGLRenderer = MGLRenderer()
 
-            if isinstance(data, pygame.Surface):
-                mgl.textures[name][0].write(data.get_view('1'))
+            texture: moderngl.Texture = mgl.textures[name][0]
+
+            if not isinstance(data, pygame.Surface):
+                texture.write(data)
+                return
+
+            if rects is None:
+                rects = mgl.dirty.pop(name, None)
             else:
-                mgl.textures[name][0].write(data)
+                mgl.dirty.pop(name, None)
+
+            if rects is None or None in rects:
+                texture.write(memoryview(data.get_view('1')).cast('B'))
+                return
+
+            bounds: pygame.Rect = data.get_rect()
+            regions: list[pygame.Rect] = []
+
+            for rect in rects:
+                rect = bounds.clip(rect)
+                if not rect.w or not rect.h:
+                    continue
+
+                for region in regions[:]:
+                    if region.colliderect(rect):
+                        rect.union_ip(region)
+                        regions.remove(region)
+
+                regions.append(rect)
+
+            if sum(region.w * region.h for region in regions) > bounds.w * bounds.h * mgl.DIRTY_THRESHOLD:
+                texture.write(memoryview(data.get_view('1')).cast('B'))
+                return
+
+            pixels: memoryview = memoryview(data.get_view('1')).cast('B')
+            pitch: int = data.get_pitch()
+            bytesize: int = data.get_bytesize()
+
+            for region in regions:
+                start: int = region.x * bytesize
+                stop: int = start + region.w * bytesize
+
+                rows: bytes = b''.join(
+                    pixels[y * pitch + start:y * pitch + stop] for y in range(region.y, region.bottom)
+                )
+
+                texture.write(rows, viewport=tuple(region))
 
     class Framebuffer:
         @staticmethod
-        def create(buffer_name: str, texture_name: str) -> None:
+        def create(buffer_name: str, texture_name: str, transient: typing.Optional[bool] = False,
+                   dimensions: typing.Optional[tuple[int, int]] = None, dtype: typing.Optional[str] = 'f1') -> None:
+
             assert MGLRenderer.instanced
             mgl: MGLRenderer = MGLRenderer()
 
+            mgl.framebuffer_textures[buffer_name] = texture_name
+            mgl._graph_dirty = True
+
+            if transient:
+                mgl.transients[texture_name] = (tuple(dimensions or mgl.screen_dimensions), dtype)
+                mgl.framebuffers[buffer_name] = None
+                return
+
             if texture_name not in mgl.textures:
-                mgl.Texture.create(texture_name, primary=False)
+                mgl.Texture.create(texture_name, primary=False, dimensions=dimensions, dtype=dtype)
 
             framebuffer: moderngl.Framebuffer = mgl.context.framebuffer(color_attachments=[mgl.textures[texture_name][0]])
             mgl.framebuffers[buffer_name] = framebuffer
@@ -63,7 +154,7 @@ class Object:
         @staticmethod
         def create(name: str, vert: typing.Union[None, str], 
                    frag: typing.Union[None, str], textures: typing.Sequence[str],
-                   framebuffer: typing.Optional[str] = None) -> None:
+                   framebuffer: typing.Optional[str] = None, keep: typing.Optional[bool] = False) -> None:
 
             assert MGLRenderer.instanced
             mgl: MGLRenderer = MGLRenderer()
@@ -77,27 +168,32 @@ def create(name: str, vert: typing.Union[None, str],
             if frag == None:
                 frag = 'default'
 
-            program: moderngl.Program = mgl.context.program(
-                vertex_shader=mgl._shaders['vert'][vert],
-                fragment_shader=mgl._shaders['frag'][frag]
-            )
+            mgl._check_name(name, mgl.objects)
+            program: moderngl.Program = mgl._get_program(vert, frag)
+
+            output: typing.Union[str, None] = None
 
             if framebuffer:
                 buffer: moderngl.Buffer = mgl.buffers[1]
+                output = mgl.framebuffer_textures[framebuffer]
                 framebuffer: moderngl.Framebuffer = mgl.framebuffers[framebuffer]
             else:
-                buffer: moderngl.Buffer = mgl.buffers[0]        
+                buffer: moderngl.Buffer = mgl.buffers[0]
 
             array: moderngl.VertexArray =  mgl.context.vertex_array(
                 program,
                 [(buffer, '2f 2f', 'vert', 'texcoord')]
             )
 
+            obj: MGLObject = MGLObject(program, array, framebuffer, textures, output, keep, buffer)
+            obj.shaders = (vert, frag)
+
             for texture in textures:
-                program[texture] = mgl.textures[texture][1]
+                if texture not in mgl.transients:
+                    obj.uniform(texture, mgl.textures[texture][1])
 
-            obj: MGLObject = MGLObject(program, array, framebuffer)
             mgl.objects[name] = obj
+            mgl._graph_dirty = True
 
         @staticmethod
         def uniform(name: str, attribute: str, value: any) -> None:
@@ -105,17 +201,116 @@ def uniform(name: str, attribute: str, value: any) -> None:
             mgl: MGLRenderer = MGLRenderer()       
 
             obj: MGLObject = mgl.objects[name]
-            obj.program[attribute] = value
+            obj.uniform(attribute, value)
             
-    def __init__(self, screen_dimensions: tuple[int, int]):
+    class Batch:
+        @staticmethod
+        def create(name: str, dimensions: typing.Optional[tuple[int, int]] = (2048, 2048),
+                   vert: typing.Optional[str] = 'batch', frag: typing.Optional[str] = 'batch',
+                   framebuffer: typing.Optional[str] = None, capacity: typing.Optional[int] = 1024,
+                   keep: typing.Optional[bool] = False) -> None:
+
+            assert MGLRenderer.instanced
+            mgl: MGLRenderer = MGLRenderer()
+
+            mgl._check_name(name, mgl.batches)
+            if name in mgl.textures:
+                if name not in mgl.batches:
+                    raise ValueError(f'[Batch] create Failed: texture {name} already exists and would be replaced by the batch atlas')
+
+                mgl.textures[name][0].release()
+
+            mgl.Texture.create(name, primary=False, dimensions=dimensions)
+            texture, location = mgl.textures[name]
+
+            program: moderngl.Program = mgl._get_program(vert, frag)
+
+            output: typing.Union[str, None] = None
+            if framebuffer:
+                output = mgl.framebuffer_textures[framebuffer]
+                framebuffer: moderngl.Framebuffer = mgl.framebuffers[framebuffer]
+
+            batch: MGLBatch = MGLBatch(mgl.context, program, texture, location, framebuffer, capacity)
+            batch.shaders = (vert, frag)
+            batch.output = output
+            batch.keep = keep
+
+            mgl.batches[name] = batch
+            mgl._graph_dirty = True
+
+        @staticmethod
+        def draw(name: str, image: pygame.Surface, position: tuple[float, float],
+                 size: typing.Optional[tuple[float, float]] = None, layer: typing.Optional[int] = 0,
+                 tint: typing.Optional[tuple[float, float, float, float]] = (1.0, 1.0, 1.0, 1.0)) -> None:
+
+            assert MGLRenderer.instanced
+            mgl: MGLRenderer = MGLRenderer()
+
+            mgl.batches[name].draw(image, position, size, layer, tint)
+
+    class Particles:
+        @staticmethod
+        def create(name: str, vert: typing.Optional[str] = 'particle', frag: typing.Optional[str] = 'batch',
+                   framebuffer: typing.Optional[str] = None, capacity: typing.Optional[int] = 4096,
+                   keep: typing.Optional[bool] = False) -> None:
+
+            assert MGLRenderer.instanced
+            mgl: MGLRenderer = MGLRenderer()
+
+            mgl._check_name(name, mgl.particles)
+            program: moderngl.Program = mgl._get_program(vert, frag)
+
+            output: typing.Union[str, None] = None
+            if framebuffer:
+                output = mgl.framebuffer_textures[framebuffer]
+                framebuffer: moderngl.Framebuffer = mgl.framebuffers[framebuffer]
+
+            particles: MGLParticles = MGLParticles(mgl.context, program, mgl.t_i, framebuffer, capacity)
+            particles.shaders = (vert, frag)
+            particles.output = output
+            particles.keep = keep
+
+            mgl.t_i += 1
+
+            mgl.particles[name] = particles
+            mgl._graph_dirty = True
+
+        @staticmethod
+        def draw(name: str, emitter: any) -> None:
+            assert MGLRenderer.instanced
+            mgl: MGLRenderer = MGLRenderer()
+
+            mgl.particles[name].draw(emitter)
+
+    SHADER_PATH: typing.Final[str] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '_resources', 'shaders')
+
+    PBO_COUNT: typing.Final[int] = 2
+    DIRTY_THRESHOLD: typing.Final[float] = 0.5
+    DIRTY_LIMIT: typing.Final[int] = 64
+
+    def __init__(self, screen_dimensions: tuple[int, int], standalone: typing.Optional[bool] = False,
+                 backend: typing.Optional[str] = None):
+
         self.screen_dimensions: tuple[int, int] = screen_dimensions
-        self.context: moderngl.Context = moderngl.create_context()
+        self.standalone: bool = standalone
+
+        if standalone:
+            self.context: moderngl.Context = moderngl.create_standalone_context(**({'backend': backend} if backend else {}))
+            self.screen: moderngl.Framebuffer = self.context.simple_framebuffer(screen_dimensions, components=4)
+        else:
+            self.context: moderngl.Context = moderngl.create_context()
+            self.screen: moderngl.Framebuffer = self.context.screen
 
         self._shaders: dict[str, dict[str, str]] = { 'vert': {}, 'frag': {} }
-        path = os.path.join('pge', '_resources', 'shaders')
-        for shader in os.listdir(path):
-            with open(os.path.join(path, shader), 'r') as s:
-                self._shaders[shader.split('.')[1]][shader.split('.')[0]] = s.read()  
+        self._shader_paths: dict[str, dict[str, str]] = { 'vert': {}, 'frag': {} }
+        self._shader_times: dict[str, int] = {}
+        self.load(self.SHADER_PATH)
+
+        self._programs: dict[str, moderngl.Program] = {}
+
+        self.hot_reload: bool = False
+        self.reload_interval: float = 0.5
+        self._reload_time: float = 0.0
 
         self.buffers: tuple[moderngl.Buffer, moderngl.Buffer] = (
             self.context.buffer(
@@ -140,23 +335,164 @@ def __init__(self, screen_dimensions: tuple[int, int]):
         self.textures: dict[str, tuple[moderngl.Texture, int]] = {}
         self.t_i: int = 0
 
+        self.dirty: dict[str, list[typing.Union[pygame.Rect, None]]] = {}
+
         self.framebuffers: dict[str, moderngl.Framebuffer] = {}
+        self.framebuffer_textures: dict[str, str] = {}
+        self.transients: dict[str, tuple[tuple[int, int], str]] = {}
+
         self.objects: dict[str, MGLObject] = {}
+        self.batches: dict[str, MGLBatch] = {}
+        self.particles: dict[str, MGLParticles] = {}
+
+        self.graph: MGLGraph = MGLGraph(self.context)
+        self._graph_dirty: bool = True
+
+        self.capture: typing.Union[MGLCapture, None] = None
 
     @property
     def shaders(self) -> dict[str, list[str]]:
         shaders: dict[str, list[str]] = {}
-        for shader in self._shaders:
-            shaders[shader] = list(self._shaders[shader].keys())
+        for shader in self._shader_paths:
+            shaders[shader] = list(dict.fromkeys([*self._shader_paths[shader], *self._shaders[shader]]))
 
         return shaders
     
     def load(self, path: str) -> None:     
         for shader in os.listdir(path):
-            with open(os.path.join(path, shader), 'r') as s:
-                self._shaders[shader.split('.')[1]][shader.split('.')[0]] = s.read()  
+            name, _, kind = shader.partition('.')
+            if kind not in self._shader_paths:
+                continue
+
+            self._shader_paths[kind][name] = os.path.join(path, shader)
+            self._shaders[kind].pop(name, None)
+
+    def _get_shader(self, kind: str, name: str) -> str:
+        if name not in self._shaders[kind]:
+            path: str = self._shader_paths[kind][name]
+            self._shader_times[path] = os.stat(path).st_mtime_ns
+
+            with open(path, 'r') as s:
+                self._shaders[kind][name] = s.read()
+
+        return self._shaders[kind][name]
+
+    def _get_program(self, vert: str, frag: str) -> moderngl.Program:
+        vertex_shader: str = self._get_shader('vert', vert)
+        fragment_shader: str = self._get_shader('frag', frag)
+
+        key: str = hashlib.sha1(f'{vertex_shader}\0{fragment_shader}'.encode()).hexdigest()
+        if key not in self._programs:
+            self._programs[key] = self.context.program(vertex_shader=vertex_shader, fragment_shader=fragment_shader)
+
+        return self._programs[key]
+
+    def reload(self) -> list[str]:
+        changed: set[tuple[str, str]] = set()
+
+        for kind, paths in self._shader_paths.items():
+            for name, path in paths.items():
+                if path not in self._shader_times:
+                    continue
+
+                try:
+                    mtime: int = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+
+                if mtime != self._shader_times[path]:
+                    self._shader_times[path] = mtime
+                    self._shaders[kind].pop(name, None)
+                    changed.add((kind, name))
+
+        if not changed:
+            return []
+
+        passes: dict[str, any] = {**self.objects, **self.batches, **self.particles}
+
+        reloaded: list[str] = []
+        for name, obj in passes.items():
+            vert, frag = obj.shaders
+            if ('vert', vert) not in changed and ('frag', frag) not in changed:
+                continue
+
+            try:
+                program: moderngl.Program = self._get_program(vert, frag)
+            except moderngl.Error as e:
+                warnings.warn(f'[MGLRenderer] reload Failed: {name} ({vert}.vert, {frag}.frag)\n{e}', RuntimeWarning)
+                continue
+
+            if isinstance(obj, (MGLBatch, MGLParticles)):
+                obj.set_program(program)
+            else:
+                obj.set_program(program, self.context.vertex_array(program, [(obj.buffer, '2f 2f', 'vert', 'texcoord')]))
+
+            reloaded.append(name)
+
+        used: set[int] = set(id(obj.program) for obj in passes.values())
+        for key, program in list(self._programs.items()):
+            if id(program) not in used:
+                program.release()
+                del self._programs[key]
+
+        return reloaded
+
+    def _check_name(self, name: str, passes: dict[str, any]) -> None:
+        for other in (self.objects, self.batches, self.particles):
+            if other is not passes and name in other:
+                raise ValueError(f'[MGLRenderer] create Failed: {name} is already used by another object, batch or particle pass')
+
+    def _allocate_transient(self, info: tuple[tuple[int, int], str]) -> tuple[moderngl.Texture, moderngl.Framebuffer, int]:
+        texture: moderngl.Texture = self.context.texture(info[0], 4, dtype=info[1])
+        texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        texture.swizzle = 'RGBA'
+        texture.use(self.t_i)
+
+        location: int = self.t_i
+        self.t_i += 1
+
+        return texture, self.context.framebuffer(color_attachments=[texture]), location
+
+    def compile(self) -> None:
+        self.graph.compile({**self.objects, **self.batches, **self.particles}, self.transients, self._allocate_transient)
+        self._graph_dirty = False
 
     def render(self) -> None:
-        objs: list[MGLObject] = list(o for o in self.objects.values())
-        for obj in objs:
-            obj.render(self.context.screen)
+        if self.hot_reload and time.perf_counter() - self._reload_time > self.reload_interval:
+            self._reload_time = time.perf_counter()
+            self.reload()
+
+        if self._graph_dirty:
+            self.compile()
+
+        profiler: Profiler = Profiler()
+
+        for name, obj in self.graph.order:
+            with profiler.gpu_scope(f'gpu.{name}', self.context):
+                obj.render(self.screen)
+
+        if self.capture:
+            self.capture.capture(self.screen)
+
+    def start_capture(self, path: str, format: typing.Optional[str] = 'png', every: typing.Optional[int] = 1,
+                      block: typing.Optional[bool] = True) -> None:
+
+        if self.capture:
+            self.stop_capture()
+
+        self.capture = MGLCapture(self.context, self.screen.size, path, format, self.PBO_COUNT + 1, every, block)
+
+    def stop_capture(self) -> int:
+        if not self.capture:
+            return 0
+
+        written: int = self.capture.close()
+        self.capture = None
+
+        return written
+
+    def snapshot(self, path: str) -> pygame.Surface:
+        image: pygame.Surface = pygame.image.frombytes(self.screen.read(components=4, alignment=1), self.screen.size, 'RGBA', True)
+        pygame.image.save(image, path)
+
+        return image
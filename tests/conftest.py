@@ -0,0 +1,27 @@
+import importlib.util
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if 'pge' not in sys.modules:
+    spec = importlib.util.spec_from_file_location('pge', os.path.join(ROOT, '__init__.py'), submodule_search_locations=[ROOT])
+    module = importlib.util.module_from_spec(spec)
+
+    sys.modules['pge'] = module
+    spec.loader.exec_module(module)
+
+import pygame
+import pytest
+
+@pytest.fixture(scope='session', autouse=True)
+def display() -> None:
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    yield
+
+    pygame.display.quit()
@@ -0,0 +1,39 @@
+from pge.core import Assets
+
+import pygame
+import pytest
+import os
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    path: str = os.path.join(tmp_path, 'image.png')
+
+    image: pygame.Surface = pygame.Surface((4, 4))
+    image.fill((200, 100, 50))
+    pygame.image.save(image, path)
+
+    yield path
+    Assets().clear()
+
+def test_load_shares_surface(path):
+    assert Assets().load(path) is Assets().load(path)
+
+def test_load_copy_is_independent(path):
+    image: pygame.Surface = Assets().load(path, copy=True)
+    image.fill((1, 2, 3))
+
+    assert image is not Assets().load(path)
+    assert Assets().load(path).get_at((0, 0)) == (200, 100, 50)
+
+def test_spritesheet_copy_option(tmp_path):
+    path: str = os.path.join(tmp_path, 'sheet.png')
+
+    sheet: pygame.Surface = pygame.Surface((5, 4))
+    sheet.set_at((4, 0), (255, 0, 0))
+    pygame.image.save(sheet, path)
+
+    shared: list[pygame.Surface] = Assets().load_spritesheet(path)
+    assert Assets().load_spritesheet(path)[0] is shared[0]
+    assert Assets().load_spritesheet(path, copy=True)[0] is not shared[0]
+
+    Assets().clear()
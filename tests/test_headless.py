@@ -0,0 +1,56 @@
+from pge.core import Input
+from pge.headless import HeadlessRunner
+
+import pygame
+import pytest
+import os
+
+@pytest.fixture
+def inputs() -> Input:
+    inputs: Input = Input()
+    inputs.reset()
+    inputs.bind('jump', pygame.K_SPACE)
+
+    yield inputs
+
+    inputs.stop_recording()
+    inputs.reset()
+
+def _record(inputs: Input, path: str, frames: list[tuple[list[int], int]]) -> None:
+    inputs.record(path)
+
+    for events, ticks in frames:
+        inputs._run([pygame.event.Event(event_type, key=pygame.K_SPACE, scancode=0, mod=0, unicode='') for event_type in events])
+        inputs._end_frame(ticks, 1.0)
+
+    inputs.stop_recording()
+
+def _update(world) -> None:
+    world.state.append((world.frame, world.inputs.is_pressed('jump'), world.inputs.is_held('jump')))
+
+def test_replay_steps_logged_ticks(inputs, tmp_path):
+    path: str = os.path.join(tmp_path, 'input.log')
+    _record(inputs, path, [([], 2), ([pygame.KEYDOWN], 0), ([], 3), ([pygame.KEYUP], 1)])
+
+    runner: HeadlessRunner = HeadlessRunner(_update, 6, workers=0)
+    result: list = runner.run([[]], replays=[path])[0]
+
+    assert result['frames'] == 6
+    assert result['result'] == [
+        (1, False, False), (2, False, False),
+        (3, True, True), (4, True, True), (5, True, True),
+        (6, False, False)
+    ]
+
+def test_replay_respects_frame_budget(inputs, tmp_path):
+    path: str = os.path.join(tmp_path, 'input.log')
+    _record(inputs, path, [([], 5)])
+
+    runner: HeadlessRunner = HeadlessRunner(_update, 3, workers=0)
+    assert runner.run([[]], replays=[path])[0]['frames'] == 3
+
+def test_in_process_run_keeps_display():
+    surface: pygame.Surface = pygame.display.get_surface()
+    HeadlessRunner(None, 1, workers=0).run(1)
+
+    assert pygame.display.get_surface() is surface
@@ -0,0 +1,73 @@
+from pge.core import Input
+from pge.core.replay import InputLog
+
+import pygame
+import pytest
+import os
+
+def _key(event_type: int, key: int) -> pygame.Event:
+    return pygame.event.Event(event_type, key=key, scancode=0, mod=0, unicode='')
+
+@pytest.fixture
+def inputs() -> Input:
+    inputs: Input = Input()
+    inputs.reset()
+    inputs.bind('jump', pygame.K_SPACE)
+    inputs.bind('fire', pygame.K_f)
+
+    yield inputs
+
+    inputs.stop_recording()
+    inputs.reset()
+
+def _frame(inputs: Input, events: list[pygame.Event], ticks: int) -> list[tuple[bool, bool]]:
+    inputs._run(events)
+
+    seen: list[tuple[bool, bool]] = []
+    for _ in range(ticks):
+        seen.append((inputs.is_pressed('jump'), inputs.is_released('jump')))
+
+    inputs._end_frame(ticks, 1.0)
+    return seen
+
+def test_press_survives_zero_tick_frame(inputs):
+    assert _frame(inputs, [_key(pygame.KEYDOWN, pygame.K_SPACE)], 0) == []
+    assert _frame(inputs, [], 1) == [(True, False)]
+    assert _frame(inputs, [], 1) == [(False, False)]
+
+def test_release_survives_zero_tick_frame(inputs):
+    _frame(inputs, [_key(pygame.KEYDOWN, pygame.K_SPACE)], 1)
+
+    assert _frame(inputs, [_key(pygame.KEYUP, pygame.K_SPACE)], 0) == []
+    assert _frame(inputs, [], 2) == [(False, True), (False, True)]
+    assert _frame(inputs, [], 1) == [(False, False)]
+
+def test_tap_within_zero_tick_frames(inputs):
+    _frame(inputs, [_key(pygame.KEYDOWN, pygame.K_SPACE)], 0)
+    _frame(inputs, [_key(pygame.KEYUP, pygame.K_SPACE)], 0)
+
+    assert _frame(inputs, [], 1) == [(True, True)]
+    assert not inputs.is_held('jump')
+
+def test_log_round_trip(inputs, tmp_path):
+    path: str = os.path.join(tmp_path, 'input.log')
+    inputs.record(path)
+
+    _frame(inputs, [_key(pygame.KEYDOWN, pygame.K_f)], 300)
+    _frame(inputs, [_key(pygame.KEYUP, pygame.K_f)], 0)
+    _frame(inputs, [], 1)
+
+    assert inputs.stop_recording() == 3
+
+    fire: int = 1 << inputs.get_actions().index('fire')
+    frames: list = list(InputLog(path).remap(inputs.get_actions()))
+
+    assert [frame[0] for frame in frames] == [300, 0, 1]
+    assert [frame[2:5] for frame in frames] == [(fire, fire, 0), (0, 0, fire), (0, 0, fire)]
+
+def test_apply_frame_restores_key_state(inputs):
+    scancode: int = pygame.key.get_pressed().__len__() - 1
+    inputs._apply_frame(0, 0, 0, (4, scancode))
+
+    assert inputs.pressed[pygame.K_a]
+    assert not inputs.pressed[pygame.K_b]
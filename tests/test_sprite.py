@@ -0,0 +1,75 @@
+from pge.core import Sprite, Assets
+from pge.utils import TransformCache
+
+import pygame
+import os
+
+def _sprite(position: tuple[float, float] = (0, 0)) -> Sprite:
+    return Sprite(pygame.Surface((8, 4)), 0, position)
+
+def test_position_not_aliased():
+    sprite: Sprite = _sprite((10, 20))
+
+    a: pygame.Vector2 = sprite.position
+    b: pygame.Vector2 = sprite.position
+    assert a is not b
+
+    a += pygame.Vector2(5, 5)
+    assert b == (10, 20)
+    assert sprite.position == (10, 20)
+    assert sprite.rect.topleft == (10, 20)
+
+def test_dimensions_not_aliased():
+    sprite: Sprite = _sprite()
+
+    dimensions: pygame.Vector2 = sprite.dimensions
+    dimensions.x = 100
+
+    assert sprite.dimensions == (8, 4)
+
+def test_position_tracks_rect():
+    sprite: Sprite = _sprite()
+
+    sprite.rect.x = 30
+    assert sprite.position == (30, 0)
+
+    sprite.rect = pygame.FRect(1, 2, 3, 4)
+    assert sprite.position == (1, 2)
+    assert sprite.dimensions == (3, 4)
+
+def test_mask_cached_until_image_changes():
+    sprite: Sprite = _sprite()
+
+    mask: pygame.Mask = sprite.mask
+    assert sprite.mask is mask
+
+    sprite.image = pygame.Surface((2, 2))
+    assert sprite.mask is not mask
+    assert sprite.mask.get_size() == (2, 2)
+
+def test_transform_shared_across_sprites(tmp_path):
+    path: str = os.path.join(tmp_path, 'image.png')
+    pygame.image.save(pygame.Surface((8, 4)), path)
+
+    cache: TransformCache = TransformCache()
+    cache.clear()
+    misses: int = cache.misses
+
+    sprites: list[Sprite] = [Sprite(path) for _ in range(10)]
+    for sprite in sprites:
+        for angle in range(0, 360, 10):
+            sprite.transform(angle)
+
+    assert cache.misses - misses == 36
+    assert sprites[0].image is sprites[1].image
+    assert sprites[0].mask is sprites[1].mask
+
+    Assets().clear()
+
+def test_transform_reuses_surface_for_same_key():
+    sprite: Sprite = _sprite()
+
+    image: pygame.Surface = sprite.transform(90)
+    assert sprite.transform(90) is image
+    assert sprite.image is image
+    assert sprite.rect.size == (4, 8)
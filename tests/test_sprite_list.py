@@ -0,0 +1,102 @@
+from pge.core import Sprite
+from pge.containers import SpriteList
+
+import pygame
+
+def _sprite(position: tuple[float, float], layer: int = 0, size: tuple[int, int] = (8, 8)) -> Sprite:
+    image: pygame.Surface = pygame.Surface(size).convert_alpha()
+    image.fill((255, 255, 255, 255))
+
+    return Sprite(image, layer, position)
+
+def test_query_rect_after_move():
+    sprite: Sprite = _sprite((0, 0))
+    sprites: SpriteList = SpriteList([sprite, _sprite((100, 100))])
+
+    assert sprites.query_rect((0, 0, 10, 10)) == [sprite]
+
+    sprite.rect.x = 500
+    sprites.update_all()
+
+    assert sprites.query_rect((0, 0, 10, 10)) == []
+    assert sprites.query_rect((500, 0, 10, 10)) == [sprite]
+    assert sprites.query_point((504, 4)) == [sprite]
+
+def test_colliding_pairs_after_move():
+    a: Sprite = _sprite((0, 0))
+    b: Sprite = _sprite((200, 200))
+    sprites: SpriteList = SpriteList([a, b])
+
+    assert sprites.colliding_pairs() == []
+
+    b.rect.topleft = (4, 4)
+    sprites.reindex()
+
+    assert [set(pair) for pair in sprites.colliding_pairs()] == [{a, b}]
+
+def test_grid_resyncs_once_per_frame():
+    queries: list[int] = []
+
+    class Seeker(Sprite):
+        def update(self, sprites: SpriteList) -> None:
+            self.rect.x += 100
+            queries.append(len(sprites.query_rect(self.rect)))
+
+    sprites: SpriteList = SpriteList([Seeker(pygame.Surface((8, 8)), 0, (i * 20, 0)) for i in range(4)])
+    sprites.query_rect((0, 0, 1, 1))
+
+    calls: list[int] = []
+    update_many = sprites._grid.update_many
+    sprites._grid.update_many = lambda objects: calls.append(1) or update_many(objects)
+
+    sprites.update_all(sprites)
+    assert len(calls) == 2
+
+    assert sprites.query_rect((100, 0, 8, 8)) == [sprites[0]]
+    assert len(calls) == 2
+
+def test_mask_offset_negative_fraction():
+    a: Sprite = _sprite((0.0, 0.0), size=(4, 4))
+    b: Sprite = _sprite((-3.5, 0.0), size=(4, 4))
+    sprites: SpriteList = SpriteList([a, b])
+
+    assert sprites.colliding_pairs(mask=True) == []
+    assert len(sprites.colliding_pairs(mask=False)) == 1
+
+def test_layer_change_during_update_all():
+    updates: dict[str, int] = {}
+
+    class Mover(Sprite):
+        def update(self) -> None:
+            updates[self.sprite_id] = updates.get(self.sprite_id, 0) + 1
+            if self.sprite_id == 'a':
+                self.layer = 10
+
+    sprites: SpriteList = SpriteList()
+    for name in 'abcde':
+        sprite: Mover = Mover(pygame.Surface((4, 4)), 0, (0, 0))
+        sprite.sprite_id = name
+        sprites.append(sprite)
+
+    sprites.update_all()
+
+    assert updates == {name: 1 for name in 'abcde'}
+    assert [sprite.sprite_id for sprite in sprites] == ['b', 'c', 'd', 'e', 'a']
+
+def test_layer_change_keeps_order():
+    sprites: SpriteList = SpriteList([_sprite((0, 0), layer) for layer in (3, 1, 2)])
+    assert [sprite.layer for sprite in sprites] == [1, 2, 3]
+
+    sprites[0].layer = 5
+    assert [sprite.layer for sprite in sprites] == [2, 3, 5]
+
+def test_deleted_sprites_removed():
+    class Bullet(Sprite):
+        def update(self) -> str:
+            return SpriteList.SPRITELIST_DELETE
+
+    keep: Sprite = _sprite((0, 0))
+    sprites: SpriteList = SpriteList([keep, Bullet(pygame.Surface((4, 4)), 0, (0, 0))])
+    sprites.update_all()
+
+    assert list(sprites) == [keep]
@@ -0,0 +1,56 @@
+from pge.core import Sprite
+from pge.containers import SpritePool, SpriteList
+
+import pygame
+import pytest
+
+class Bullet(Sprite):
+    def __init__(self, image: pygame.Surface, position: tuple[float, float], speed: float):
+        Sprite.__init__(self, image, 0, position)
+        self.speed: float = speed
+
+    def reset(self, image: pygame.Surface, position: tuple[float, float], speed: float) -> None:
+        Sprite.reset(self, image, 0, position)
+        self.speed = speed
+
+class Plain(Sprite):
+    ...
+
+class Stateful(Sprite):
+    def __init__(self, image: pygame.Surface):
+        Sprite.__init__(self, image)
+        self.hits: int = 0
+
+def test_acquire_reuses_released_sprite():
+    image: pygame.Surface = pygame.Surface((4, 4))
+    pool: SpritePool = SpritePool(Bullet)
+
+    bullet: Bullet = pool.acquire(image, (1, 2), 3.0)
+    original: pygame.Surface = bullet.original_image
+    rect: pygame.FRect = bullet.rect
+
+    bullet.transform(90)
+    assert pool.release(bullet)
+
+    again: Bullet = pool.acquire(image, (5, 6), 7.0)
+    assert again is bullet
+    assert again.speed == 7.0
+    assert again.rect.topleft == (5, 6)
+    assert again.image.get_size() == (4, 4)
+    assert again.image is original
+    assert again.rect is rect
+    assert pool.stats['hits'] == 1
+
+def test_sprites_in_lists_are_discarded():
+    pool: SpritePool = SpritePool(Plain)
+    sprites: SpriteList = SpriteList()
+
+    sprite: Plain = pool.acquire(pygame.Surface((4, 4)))
+    sprites.append(sprite)
+
+    assert not pool.release(sprite)
+    assert pool.discarded == 1
+
+def test_init_without_reset_rejected():
+    with pytest.raises(TypeError):
+        SpritePool(Stateful)
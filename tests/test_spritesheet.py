@@ -0,0 +1,47 @@
+from pge.utils import load_spritesheet
+
+import pygame
+import os
+
+STOP: tuple[int, int, int, int] = (255, 0, 0, 255)
+
+def _save_sheet(path: str, frames: int) -> None:
+    sheet: pygame.Surface = pygame.Surface((frames * 5, 4), pygame.SRCALPHA)
+    sheet.fill((10, 20, 30, 0))
+
+    for frame in range(frames):
+        for i in range(6):
+            sheet.set_at((frame * 5 + i % 4, i // 4), (255, 255, 255, 255))
+
+        sheet.set_at((frame * 5 + 4, 0), STOP)
+
+    pygame.image.save(sheet, path)
+
+def test_transparent_pixels_excluded_from_mask(tmp_path):
+    path: str = os.path.join(tmp_path, 'sheet.png')
+    _save_sheet(path, 1)
+
+    images: list[pygame.Surface] = load_spritesheet(path)
+
+    assert len(images) == 1
+    assert images[0].get_size() == (4, 4)
+    assert pygame.mask.from_surface(images[0]).count() == 6
+
+def test_frames_are_independent(tmp_path):
+    path: str = os.path.join(tmp_path, 'sheet.png')
+    _save_sheet(path, 2)
+
+    first, second = load_spritesheet(path)
+    first.fill((1, 2, 3))
+
+    assert second.get_at((0, 0)) == (255, 255, 255, 255)
+
+def test_layout_cache_invalidated(tmp_path):
+    path: str = os.path.join(tmp_path, 'sheet.png')
+
+    _save_sheet(path, 1)
+    assert len(load_spritesheet(path)) == 1
+    assert os.path.exists(path + '.slices')
+
+    _save_sheet(path, 3)
+    assert len(load_spritesheet(path)) == 3
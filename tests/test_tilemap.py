@@ -0,0 +1,38 @@
+from pge.containers import Tilemap
+from pge.core import Camera
+
+import pygame
+import pytest
+
+def _tilemap() -> Tilemap:
+    tile: pygame.Surface = pygame.Surface((4, 4))
+    tile.fill((255, 0, 0))
+
+    return Tilemap([tile], (8, 8), chunk_size=4)
+
+def test_scaled_chunks_cached_until_edit():
+    tilemap: Tilemap = _tilemap()
+    tilemap.fill((0, 0, 8, 8), 0)
+
+    surface: pygame.Surface = pygame.Surface((64, 64))
+    camera: Camera = Camera((0, 0, 64, 64), (0, 0), zoom=2.0)
+
+    tilemap.render(surface, camera)
+    scaled: pygame.Surface = tilemap.get_scaled_chunk((0, 0), 2.0)
+
+    tilemap.render(surface, camera)
+    assert tilemap.get_scaled_chunk((0, 0), 2.0) is scaled
+    assert scaled.get_size() == (32, 32)
+
+    tilemap.set_tile(0, 0, -1)
+    assert tilemap.get_scaled_chunk((0, 0), 2.0) is not scaled
+    assert tilemap.get_scaled_chunk((1, 1), 2.0) is tilemap.get_scaled_chunk((1, 1), 2.0)
+
+def test_load_rejects_oversized_rows():
+    tilemap: Tilemap = _tilemap()
+
+    with pytest.raises(ValueError):
+        tilemap.load([[0] * 9])
+
+    with pytest.raises(ValueError):
+        tilemap.load([[0]] * 9)
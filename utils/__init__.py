@@ -1,4 +1,6 @@
 from pge.utils.functions import *
-from pge.utils.spritesheet_loader import load_spritesheet
-from pge.utils.bezier import Bezier, BezierInfo
+from pge.utils.spritesheet_loader import load_spritesheet, load_spritesheet_uvs, get_spritesheet_layout
+from pge.utils.bezier import Bezier, BezierInfo, BezierTable
 from pge.utils.easings import Easings
+from pge.utils.profiler import Profiler
+from pge.utils.transform_cache import TransformCache
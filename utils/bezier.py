@@ -1,10 +1,86 @@
 from pge.types import Singleton
 
 import dataclasses
-import math
+import array
 import typing
 
 BezierInfo = typing.NewType('BezierInfo', typing.Sequence[typing.Union[tuple[int, int], int]])
+Coefficients = typing.NewType('Coefficients', tuple[float, float, float, float])
+
+SOLVE_EPSILON: typing.Final[float] = 1e-7
+SOLVE_ITERATIONS: typing.Final[int] = 8
+
+def sample_table(values: typing.Sequence[float], resolution: int, ts: typing.Iterable[float]) -> list[float]:
+    first: float = values[0]
+    last: float = values[-1]
+
+    result: list[float] = []
+    for t in ts:
+        if t <= 0:
+            result.append(first)
+        elif t >= 1:
+            result.append(last)
+        else:
+            position: float = t * resolution
+            index: int = int(position)
+            result.append(values[index] + (values[index + 1] - values[index]) * (position - index))
+
+    return result
+
+def write_array(values: typing.Sequence[float], out: typing.Optional[array.array] = None) -> array.array:
+    if out is None:
+        return array.array('d', values)
+
+    if len(out) < len(values):
+        raise ValueError(f'[Bezier] write_array Failed: out holds {len(out)} values, {len(values)} required')
+
+    out[:len(values)] = array.array(out.typecode, values)
+    return out
+
+def _get_coefficients(data: BezierInfo, axis: int) -> Coefficients:
+    p_0: float = data[0][axis]
+    p_1: float = data[1][axis]
+    p_2: float = data[2][axis]
+    p_3: float = data[3][axis]
+
+    return (
+        -p_0 + 3 * p_1 - 3 * p_2 + p_3,
+        3 * p_0 - 6 * p_1 + 3 * p_2,
+        -3 * p_0 + 3 * p_1,
+        p_0
+    )
+
+def _solve(x: float, data: BezierInfo) -> float:
+    ax, bx, cx, dx = _get_coefficients(data, 0)
+    ay, by, cy, dy = _get_coefficients(data, 1)
+
+    t: float = x
+    for _ in range(SOLVE_ITERATIONS):
+        error: float = ((ax * t + bx) * t + cx) * t + dx - x
+        if abs(error) < SOLVE_EPSILON:
+            return ((ay * t + by) * t + cy) * t + dy
+
+        slope: float = (3 * ax * t + 2 * bx) * t + cx
+        if abs(slope) < SOLVE_EPSILON:
+            break
+
+        t -= error / slope
+        if not 0 <= t <= 1:
+            break
+
+    low: float = 0.0
+    high: float = 1.0
+    t = min(max(x, low), high)
+
+    while high - low > SOLVE_EPSILON:
+        if ((ax * t + bx) * t + cx) * t + dx < x:
+            low = t
+        else:
+            high = t
+
+        t = (low + high) / 2
+
+    return ((ay * t + by) * t + cy) * t + dy
 
 @Singleton
 class Bezier:
@@ -16,28 +92,68 @@ def SINE() -> BezierInfo:
         @property
         def EASE_OUT() -> BezierInfo:
             return [[0, 0], [1, 0.09], [1, .95], [1, 0], 0]
-        
+
         @property
         def EASE_IN() -> BezierInfo:
-            return [[0, 0], [0, 0.09], [0, .95], [1, 0], 0]   
+            return [[0, 0], [0, 0.09], [0, .95], [1, 0], 0]
 
     @staticmethod
     def get_bezier_point(t: float, data: BezierInfo) -> float:
-        p_0: tuple[float, float] = data[0]
-        p_1: tuple[float, float] = data[1]
-        p_2: tuple[float, float] = data[2]
-        p_3: tuple[float, float] = data[3]
-
-        p = [
-            math.pow(1 - t, 3) * p_0[0]
-            + 3 * t * math.pow(1 - t, 2) * p_1[0]
-            + 3 * math.pow(t, 2) * (1 - t) * p_2[0]
-            + math.pow(t, 3) * p_3[0],
-
-            math.pow(1 - t, 3) * p_0[1]
-            + 3 * t * math.pow(1 - t, 2) * p_1[1]
-            + 3 * math.pow(t, 2) * (1 - t) * p_2[1]
-            + math.pow(t, 3) * p_3[1]
-        ]
-
-        return p[data[4]]
+        a, b, c, d = _get_coefficients(data, data[4])
+        return ((a * t + b) * t + c) * t + d
+
+    @staticmethod
+    def get_bezier_points(ts: typing.Sequence[float], data: BezierInfo,
+                          out: typing.Optional[array.array] = None) -> array.array:
+
+        a, b, c, d = _get_coefficients(data, data[4])
+        return write_array([((a * t + b) * t + c) * t + d for t in ts], out)
+
+    @staticmethod
+    def get_curve_points(t: float, curves: typing.Sequence[BezierInfo]) -> array.array:
+        u: float = 1 - t
+
+        w_0: float = u * u * u
+        w_1: float = 3 * t * u * u
+        w_2: float = 3 * t * t * u
+        w_3: float = t * t * t
+
+        return array.array('d', [
+            w_0 * data[0][data[4]] + w_1 * data[1][data[4]] + w_2 * data[2][data[4]] + w_3 * data[3][data[4]]
+            for data in curves
+        ])
+
+    @staticmethod
+    def solve(x: float, data: BezierInfo) -> float:
+        return _solve(x, data)
+
+class BezierTable:
+    def __init__(self, data: BezierInfo, resolution: typing.Optional[int] = 256, solve: typing.Optional[bool] = False):
+        self.data: BezierInfo = data
+        self.resolution: int = resolution
+        self.solve: bool = solve
+
+        step: float = 1 / resolution
+        if solve:
+            self.values: array.array = array.array('d', (_solve(i * step, data) for i in range(resolution + 1)))
+        else:
+            a, b, c, d = _get_coefficients(data, data[4])
+            ts: list[float] = [i * step for i in range(resolution + 1)]
+
+            self.values: array.array = array.array('d', [((a * t + b) * t + c) * t + d for t in ts])
+
+    def get(self, t: float) -> float:
+        if t <= 0:
+            return self.values[0]
+
+        if t >= 1:
+            return self.values[-1]
+
+        position: float = t * self.resolution
+        index: int = int(position)
+        fraction: float = position - index
+
+        return self.values[index] + (self.values[index + 1] - self.values[index]) * fraction
+
+    def get_many(self, ts: typing.Sequence[float], out: typing.Optional[array.array] = None) -> array.array:
+        return write_array(sample_table(self.values, self.resolution, ts), out)
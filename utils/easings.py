@@ -1,10 +1,119 @@
 from pge.types import Singleton
-from pge.utils import Bezier, BezierInfo
+from pge.utils.bezier import BezierInfo, BezierTable, sample_table, write_array
 
 import dataclasses
+import array
 import typing
+import math
 
 T = typing.TypeVar('T')
+EasingFunction = typing.NewType('EasingFunction', typing.Callable[[float], float])
+
+def _bounce(t: float) -> float:
+    if t < 1 / 2.75:
+        return 7.5625 * t * t
+
+    if t < 2 / 2.75:
+        t -= 1.5 / 2.75
+        return 7.5625 * t * t + 0.75
+
+    if t < 2.5 / 2.75:
+        t -= 2.25 / 2.75
+        return 7.5625 * t * t + 0.9375
+
+    t -= 2.625 / 2.75
+    return 7.5625 * t * t + 0.984375
+
+_EASE_IN: typing.Final[dict[str, EasingFunction]] = {
+    'quad': lambda t: t * t,
+    'cubic': lambda t: t * t * t,
+    'quart': lambda t: t * t * t * t,
+    'quint': lambda t: t * t * t * t * t,
+    'sine': lambda t: 1 - math.cos(t * math.pi / 2),
+    'expo': lambda t: 0.0 if t == 0 else math.pow(2, 10 * t - 10),
+    'circ': lambda t: 1 - math.sqrt(max(0.0, 1 - t * t)),
+    'back': lambda t: 2.70158 * t * t * t - 1.70158 * t * t,
+    'elastic': lambda t: t if t in (0, 1) else -math.pow(2, 10 * t - 10) * math.sin((t * 10 - 10.75) * (2 * math.pi / 3)),
+    'bounce': lambda t: 1 - _bounce(1 - t)
+}
+
+def _get_out(ease_in: EasingFunction) -> EasingFunction:
+    return lambda t: 1 - ease_in(1 - t)
+
+def _get_in_out(ease_in: EasingFunction) -> EasingFunction:
+    return lambda t: ease_in(2 * t) / 2 if t < 0.5 else 1 - ease_in(2 - 2 * t) / 2
+
 @Singleton
 class Easings:
-    ...
+    CSS: typing.Final[dict[str, tuple[float, float, float, float]]] = {
+        'ease': (0.25, 0.1, 0.25, 1.0),
+        'ease_in': (0.42, 0.0, 1.0, 1.0),
+        'ease_out': (0.0, 0.0, 0.58, 1.0),
+        'ease_in_out': (0.42, 0.0, 0.58, 1.0)
+    }
+
+    RESOLUTION: typing.Final[int] = 256
+
+    def __init__(self):
+        self.resolution: int = self.RESOLUTION
+
+        self._functions: dict[str, EasingFunction] = {'linear': lambda t: t}
+        for name, ease_in in _EASE_IN.items():
+            self._functions[f'in_{name}'] = ease_in
+            self._functions[f'out_{name}'] = _get_out(ease_in)
+            self._functions[f'in_out_{name}'] = _get_in_out(ease_in)
+
+        self._curves: dict[tuple[tuple[float, ...], int], BezierTable] = {}
+        self._tables: dict[tuple[str, int], array.array] = {}
+
+        for name, points in self.CSS.items():
+            self._functions[name] = self.cubic_bezier(*points).get
+
+    @property
+    def names(self) -> tuple[str]:
+        return tuple(self._functions)
+
+    def get(self, name: str) -> EasingFunction:
+        return self._functions[name]
+
+    def register(self, name: str, func: EasingFunction) -> None:
+        self._functions[name] = func
+
+        for key in [key for key in self._tables if key[0] == name]:
+            del self._tables[key]
+
+    def cubic_bezier(self, x_1: float, y_1: float, x_2: float, y_2: float,
+                     resolution: typing.Optional[int] = None) -> BezierTable:
+
+        key: tuple[tuple[float, ...], int] = ((x_1, y_1, x_2, y_2), resolution or self.resolution)
+        if key not in self._curves:
+            data: BezierInfo = [[0, 0], [x_1, y_1], [x_2, y_2], [1, 1], 1]
+            self._curves[key] = BezierTable(data, key[1], solve=True)
+
+        return self._curves[key]
+
+    def table(self, name: str, resolution: typing.Optional[int] = None) -> array.array:
+        resolution = resolution or self.resolution
+
+        key: tuple[str, int] = (name, resolution)
+        if key not in self._tables:
+            func: EasingFunction = self._functions[name]
+            self._tables[key] = array.array('d', [func(i / resolution) for i in range(resolution + 1)])
+
+        return self._tables[key]
+
+    def ease(self, name: str, t: float) -> float:
+        return self._functions[name](min(max(t, 0.0), 1.0))
+
+    def ease_many(self, name: str, ts: typing.Sequence[float], out: typing.Optional[array.array] = None) -> array.array:
+        func: EasingFunction = self._functions[name]
+        return write_array([func(0.0 if t < 0 else 1.0 if t > 1 else t) for t in ts], out)
+
+    def ease_table(self, name: str, ts: typing.Sequence[float], resolution: typing.Optional[int] = None,
+                   out: typing.Optional[array.array] = None) -> array.array:
+
+        resolution = resolution or self.resolution
+        return write_array(sample_table(self.table(name, resolution), resolution, ts), out)
+
+    def interpolate(self, start: T, end: T, t: float, name: typing.Optional[str] = 'linear') -> T:
+        return start + (end - start) * self.ease(name, t)
@@ -1,4 +1,5 @@
 import inspect
+import weakref
 import typing
 import pygame
 import math
@@ -19,6 +20,16 @@ def scale(image, sx: float, sy: typing.Optional[float] = None) -> pygame.Surface
     if not sy: sy = sx
     return pygame.transform.scale(image, (image.get_width() * sx, image.get_height() * sy)).convert_alpha()
 
+_MASKS: weakref.WeakKeyDictionary[pygame.Surface, pygame.Mask] = weakref.WeakKeyDictionary()
+
+def get_mask(image: pygame.Surface) -> pygame.Mask:
+    mask: typing.Union[pygame.Mask, None] = _MASKS.get(image)
+    if mask is None:
+        mask = pygame.mask.from_surface(image)
+        _MASKS[image] = mask
+
+    return mask
+
 def clamp(v: float, mi: float, mx: float) -> float:
     return max(mi, min(v, mx))
 
@@ -0,0 +1,177 @@
+from pge.types import Singleton
+
+import collections
+import pygame
+import typing
+import json
+import time
+import csv
+
+if typing.TYPE_CHECKING:
+    import moderngl
+
+class _NullScope:
+    def __enter__(self) -> None:
+        ...
+
+    def __exit__(self, *args: typing.Sequence[any]) -> None:
+        ...
+
+class _Scope:
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler: Profiler = profiler
+        self.name: str = name
+
+    def __enter__(self) -> None:
+        self.profiler.begin(self.name)
+
+    def __exit__(self, *args: typing.Sequence[any]) -> None:
+        self.profiler.end(self.name)
+
+class _GPUScope:
+    def __init__(self, profiler: 'Profiler', name: str, context: 'moderngl.Context'):
+        self.profiler: Profiler = profiler
+        self.name: str = name
+
+        self.current: moderngl.Query = context.query(time=True)
+        self.previous: moderngl.Query = context.query(time=True)
+        self.previous_used: bool = False
+
+    def __enter__(self) -> None:
+        self.current.__enter__()
+
+    def __exit__(self, *args: typing.Sequence[any]) -> None:
+        self.current.__exit__(*args)
+
+        if self.previous_used:
+            self.profiler.record(self.name, self.previous.elapsed / 1e9)
+
+        self.current, self.previous = self.previous, self.current
+        self.previous_used = True
+
+@Singleton
+class Profiler:
+    HISTORY: typing.Final[int] = 240
+
+    _NULL_SCOPE: typing.Final[_NullScope] = _NullScope()
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.gpu: bool = True
+        self.overlay: bool = True
+
+        self.history: int = self.HISTORY
+
+        self._histories: dict[str, collections.deque[float]] = {}
+        self._frame: dict[str, float] = {}
+        self._starts: dict[str, float] = {}
+        self._scopes: dict[str, _Scope] = {}
+
+        self._queries: dict[str, _GPUScope] = {}
+
+    def begin(self, name: str) -> None:
+        if not self.enabled:
+            return
+
+        self._starts[name] = time.perf_counter()
+
+    def end(self, name: str) -> None:
+        if not self.enabled:
+            return
+
+        start: typing.Union[float, None] = self._starts.pop(name, None)
+        if start is not None:
+            self.record(name, time.perf_counter() - start)
+
+    def scope(self, name: str) -> typing.Union[_Scope, _NullScope]:
+        if not self.enabled:
+            return self._NULL_SCOPE
+
+        if name not in self._scopes:
+            self._scopes[name] = _Scope(self, name)
+
+        return self._scopes[name]
+
+    def gpu_scope(self, name: str, context: 'moderngl.Context') -> typing.Union[_GPUScope, _NullScope]:
+        if not (self.enabled and self.gpu):
+            return self._NULL_SCOPE
+
+        if name not in self._queries:
+            self._queries[name] = _GPUScope(self, name, context)
+
+        return self._queries[name]
+
+    def record(self, name: str, seconds: float) -> None:
+        self._frame[name] = self._frame.get(name, 0.0) + seconds
+
+    def _run(self) -> None:
+        if not self.enabled:
+            return
+
+        for name, seconds in self._frame.items():
+            if name not in self._histories:
+                self._histories[name] = collections.deque(maxlen=self.history)
+
+            self._histories[name].append(seconds)
+
+        self._frame.clear()
+
+    def stats(self, name: str) -> dict[str, float]:
+        history: collections.deque[float] = self._histories.get(name, ())
+        if not history:
+            return {'last': 0.0, 'average': 0.0, 'min': 0.0, 'max': 0.0}
+
+        return {
+            'last': history[-1],
+            'average': sum(history) / len(history),
+            'min': min(history),
+            'max': max(history)
+        }
+
+    def clear(self) -> None:
+        self._histories.clear()
+        self._frame.clear()
+        self._starts.clear()
+
+    def render(self, surface: pygame.Surface, position: typing.Optional[tuple[int, int]] = (4, 4),
+               color: typing.Optional[tuple[int, int, int]] = (255, 255, 255)) -> None:
+
+        from pge.core import Font
+
+        font: Font = Font()
+        y: int = position[1]
+
+        for name in sorted(self._histories):
+            stats: dict[str, float] = self.stats(name)
+            label: str = font.sanitize(f'{name} {stats["average"] * 1000:.2f} {stats["max"] * 1000:.2f}')
+
+            image: pygame.Surface = font.create(label, color=color)
+
+            surface.blit(image, (position[0], y))
+            y += image.get_height() + 1
+
+    def export(self, path: str) -> None:
+        names: list[str] = sorted(self._histories)
+
+        if path.endswith('.csv'):
+            length: int = max((len(self._histories[name]) for name in names), default=0)
+
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame', *names])
+
+                for i in range(length):
+                    row: list[typing.Union[int, float]] = [i]
+                    for name in names:
+                        history: collections.deque[float] = self._histories[name]
+                        offset: int = i - (length - len(history))
+                        row.append(history[offset] if offset >= 0 else '')
+
+                    writer.writerow(row)
+
+            return
+
+        with open(path, 'w') as f:
+            json.dump({
+                name: {'stats': self.stats(name), 'history': list(self._histories[name])} for name in names
+            }, f, indent=4)
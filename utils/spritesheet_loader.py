@@ -1,42 +1,98 @@
 import pygame
 import typing
+import json
+import os
 
 SPRITESHEET_STOP_COLOR: typing.Final[tuple[int, int, int, int]] = (255, 0, 0, 255)
+SPRITESHEET_LAYOUT_EXTENSION: typing.Final[str] = '.slices'
 
-def load_spritesheet(path: str, frames: typing.Optional[typing.Sequence[int]] = None, 
+def _scan_spritesheet(sheet: pygame.Surface) -> list[tuple[int, int]]:
+    row: bytes = pygame.image.tobytes(sheet.subsurface((0, 0, sheet.get_width(), 1)), 'RGBA')
+    stop_color: bytes = bytes(SPRITESHEET_STOP_COLOR)
+
+    slices: list[tuple[int, int]] = []
+    start: int = 0
+
+    i: int = row.find(stop_color)
+    while i != -1:
+        if i % 4:
+            i = row.find(stop_color, i + 1)
+            continue
+
+        stop: int = i // 4
+        slices.append((start, stop))
+        start = stop + 1
+
+        i = row.find(stop_color, i + 4)
+
+    return slices
+
+def get_spritesheet_layout(sheet: pygame.Surface, path: typing.Optional[str] = None) -> list[tuple[int, int]]:
+    if not path:
+        return _scan_spritesheet(sheet)
+
+    layout_path: str = path + SPRITESHEET_LAYOUT_EXTENSION
+    stat: os.stat_result = os.stat(path)
+    signature: list[int] = [stat.st_mtime_ns, stat.st_size, sheet.get_width(), sheet.get_height()]
+
+    try:
+        with open(layout_path, 'r') as f:
+            layout: dict[str, list] = json.load(f)
+
+        if layout['signature'] == signature:
+            return [tuple(s) for s in layout['slices']]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    slices: list[tuple[int, int]] = _scan_spritesheet(sheet)
+
+    try:
+        with open(layout_path, 'w') as f:
+            json.dump({'signature': signature, 'slices': slices}, f)
+    except OSError:
+        pass
+
+    return slices
+
+def load_spritesheet(path: typing.Union[str, pygame.Surface], frames: typing.Optional[typing.Sequence[int]] = None,
                      colorkey: typing.Optional[tuple[int, int, int]] = (0, 0, 0),
-                     scale: typing.Optional[float] = 1.0) -> list[pygame.Surface]:
+                     scale: typing.Optional[float] = 1.0, cache_path: typing.Optional[str] = None) -> list[pygame.Surface]:
 
-    images: list[pygame.Surface] = []
-    sheet: pygame.Surface = pygame.image.load(path).convert_alpha()
+    if isinstance(path, pygame.Surface):
+        sheet: pygame.Surface = path.convert_alpha()
+    else:
+        sheet: pygame.Surface = pygame.image.load(path).convert_alpha()
+        cache_path = path
 
-    width: int = sheet.get_width()
+    images: list[pygame.Surface] = []
     height: int = sheet.get_height()
 
-    image_count: int = 0
-    start: int = 0
-    stop: int = 0
-    i: int = 0
-
-    for i in range(width):
-        if sheet.get_at((i, 0)) != SPRITESHEET_STOP_COLOR:
-            continue
-    
-        stop = i
+    for image_count, (start, stop) in enumerate(get_spritesheet_layout(sheet, cache_path)):
         image: pygame.Surface = pygame.Surface((stop - start, height)).convert_alpha()
         image.set_colorkey(colorkey)
         image.blit(sheet, (0, 0), (start, 0, stop - start, height))
 
         if scale != 1.0:
             image = pygame.transform.scale(image, (image.get_width() * scale, image.get_height() * scale)).convert_alpha()
-            
+
         if frames:
-            for _ in range(frames[image_count]):
-                images.append(image)
+            images.extend([image] * frames[image_count])
         else:
             images.append(image)
 
-        image_count += 1
-        start = stop + 1
-
     return images
+
+def load_spritesheet_uvs(path: typing.Union[str, pygame.Surface],
+                         cache_path: typing.Optional[str] = None) -> tuple[pygame.Surface, list[tuple[float, float, float, float]]]:
+
+    if isinstance(path, pygame.Surface):
+        sheet: pygame.Surface = path.convert_alpha()
+    else:
+        sheet: pygame.Surface = pygame.image.load(path).convert_alpha()
+        cache_path = path
+
+    width, height = sheet.get_size()
+
+    return sheet, [
+        (start / width, 0.0, (stop - start) / width, 1.0) for start, stop in get_spritesheet_layout(sheet, cache_path)
+    ]
@@ -0,0 +1,98 @@
+from pge.types import Singleton
+
+import collections
+import pygame
+import typing
+
+TransformKey = typing.NewType('TransformKey', tuple[pygame.Surface, int, int, tuple[bool, bool]])
+
+@Singleton
+class TransformCache:
+    MEMORY_BUDGET: typing.Final[int] = 64 * 1024 * 1024
+
+    ANGLE_STEP: typing.Final[float] = 1.0
+    SCALE_STEP: typing.Final[float] = 0.01
+
+    def __init__(self):
+        self._surfaces: collections.OrderedDict[TransformKey, pygame.Surface] = collections.OrderedDict()
+        self._size: int = 0
+
+        self.budget: int = self.MEMORY_BUDGET
+
+        self.angle_step: float = self.ANGLE_STEP
+        self.scale_step: float = self.SCALE_STEP
+        self.smooth: bool = False
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def _get_size(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _get_key(self, source: pygame.Surface, angle: float, scale: float, flip: tuple[bool, bool]) -> TransformKey:
+        buckets: int = round(360 / self.angle_step)
+        return (source, round(angle / self.angle_step) % buckets, round(scale / self.scale_step), (bool(flip[0]), bool(flip[1])))
+
+    def _transform(self, key: TransformKey) -> pygame.Surface:
+        source, angle_bucket, scale_bucket, flip = key
+
+        angle: float = angle_bucket * self.angle_step
+        scale: float = scale_bucket * self.scale_step
+
+        surface: pygame.Surface = source
+        if flip[0] or flip[1]:
+            surface = pygame.transform.flip(surface, *flip)
+
+        if self.smooth:
+            return pygame.transform.rotozoom(surface, angle, scale)
+
+        if scale != 1:
+            surface = pygame.transform.scale_by(surface, scale)
+
+        if angle:
+            surface = pygame.transform.rotate(surface, angle)
+
+        return surface if surface is not source else source.copy()
+
+    def _evict(self) -> None:
+        while self._size > self.budget and len(self._surfaces) > 1:
+            _, surface = self._surfaces.popitem(last=False)
+            self._size -= self._get_size(surface)
+
+    def get(self, source: pygame.Surface, angle: typing.Optional[float] = 0.0, scale: typing.Optional[float] = 1.0,
+            flip: typing.Optional[tuple[bool, bool]] = (False, False)) -> pygame.Surface:
+
+        # returned surfaces are shared between callers; copy before drawing onto or assigning one
+        key: TransformKey = self._get_key(source, angle, scale, flip)
+
+        surface: typing.Union[pygame.Surface, None] = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+
+        surface = self._transform(key)
+
+        self._surfaces[key] = surface
+        self._size += self._get_size(surface)
+        self._evict()
+
+        return surface
+
+    def pregenerate(self, source: pygame.Surface, scale: typing.Optional[float] = 1.0,
+                    flip: typing.Optional[tuple[bool, bool]] = (False, False),
+                    angle_step: typing.Optional[float] = None) -> list[pygame.Surface]:
+
+        step: float = angle_step or self.angle_step
+        return [self.get(source, i * step, scale, flip) for i in range(round(360 / step))]
+
+    def discard(self, source: pygame.Surface) -> None:
+        for key in [key for key in self._surfaces if key[0] is source]:
+            self._size -= self._get_size(self._surfaces.pop(key))
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self._size = 0